@@ -1,3 +1,10 @@
 from .astar import aStar
 from .depth_first import depthFirst
-from .breadth_first import breadthFirstSearch
\ No newline at end of file
+from .breadth_first import breadthFirstSearch
+from .dijkstra import dijkstra
+from .jump_point import jumpPointSearch
+from .any_angle import thetaStar, lazyThetaStar
+from .bidirectional import bidirectionalAStar, bidirectionalBreadthFirstSearch
+from .hierarchical import hierarchicalAStar
+from .incremental import incrementalAStar
+from .multi_agent import cooperativeAStar
@@ -0,0 +1,47 @@
+from node import Node
+from gui import Gui
+import solvers
+
+
+def thetaStar(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Theta* algorithm on the window, drawing every step of the search
+
+    See "solvers.thetaStar" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    return gui.solve(solvers.thetaStar, start, end).found
+
+
+def lazyThetaStar(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Lazy Theta* algorithm on the window, drawing every step of the search
+
+    See "solvers.lazyThetaStar" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    return gui.solve(solvers.lazyThetaStar, start, end).found
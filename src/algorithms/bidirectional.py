@@ -0,0 +1,47 @@
+from node import Node
+from gui import Gui
+import solvers
+
+
+def bidirectionalBreadthFirstSearch(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Bidirectional Breadth-First Search algorithm on the window, drawing every step of the search
+
+    See "solvers.bidirectionalBreadthFirstSearch" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    return gui.solve(solvers.bidirectionalBreadthFirstSearch, start, end).found
+
+
+def bidirectionalAStar(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Bidirectional A* algorithm on the window, drawing every step of the search
+
+    See "solvers.bidirectionalAStar" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    return gui.solve(solvers.bidirectionalAStar, start, end).found
@@ -1,19 +1,17 @@
 from node import Node
 from gui import Gui
-import pygame
+import solvers
 
 
 def depthFirst(gui:Gui, start:Node, end:Node) -> bool:
-    """Runs Depth-First Search Algorithm
+    """Runs Depth-First Search algorithm on the window, drawing every step of the search
 
-    This algorithm explores as far as possible along each branch of a tree (or graph) before backtracking.
-
-    Reference = [https://en.wikipedia.org/wiki/Depth-first_search]
+    See "solvers.depthFirst" for the headless version.
 
     Parameters
     ----------
-    nodes : list
-        A list of nodes present in the grid
+    gui : Gui
+        The user interface holding the nodes
     start : Node
         The starting point
     end : Node
@@ -24,39 +22,4 @@ def depthFirst(gui:Gui, start:Node, end:Node) -> bool:
     bool
         True if the ending node was reached, else False
     """
-    def buildReversePath(came_from:dict, current:Node):
-        while current in came_from:
-            current = came_from[current]
-            current.setState("path")
-            gui.updateContents()
-
-    came_from = {}
-    open_set = [start] # The LIFO data structure for exploring as far as possible along each branch
-    visited = []
-
-    while open_set:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                gui.close()
-
-        current = open_set.pop(-1)
-        visited.append(current)
-
-        if current == end:
-            buildReversePath(came_from, end)
-            end.setState("end point")
-            start.setState("start point")
-            return True
-
-        for neighbor in current.neighbors:
-            if neighbor not in visited:
-                came_from[neighbor] = current
-                open_set.append(neighbor)
-                neighbor.setState("watch")
-                gui.updateContents()
-
-        if current != start:
-            current.setState("visited")
-            gui.updateContents()
-
-    return False
\ No newline at end of file
+    return gui.solve(solvers.depthFirst, start, end).found
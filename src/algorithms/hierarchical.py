@@ -0,0 +1,36 @@
+from node import Node
+from gui import Gui
+import solvers
+
+
+def hierarchicalAStar(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Hierarchical Path-Finding A* (HPA*) on the window, drawing every step of the search
+
+    The planner is created on the first run and kept in "gui.planners", so the following
+    runs reuse its cluster abstraction and only recompute the clusters whose walls changed.
+    See "solvers.HierarchicalPlanner" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    planner = gui.planners.get("hierarchical")
+    if planner is None:
+        planner = gui.planners["hierarchical"] = solvers.HierarchicalPlanner(gui.model)
+
+    result = planner.query(start.index, end.index, observer=gui.showStep)
+    gui.play()
+    if result:
+        end.setState("end point")
+        start.setState("start point")
+    return result.found
@@ -0,0 +1,36 @@
+from node import Node
+from gui import Gui
+import solvers
+
+
+def incrementalAStar(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Lifelong Planning A* (LPA*) on the window, drawing every step of the search
+
+    The planner is created on the first run and kept in "gui.planners". Running it again
+    after drawing or erasing a few walls only repairs the part of the previous search
+    affected by them. See "solvers.IncrementalPlanner" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    planner = gui.planners.get("incremental")
+    if planner is None:
+        planner = gui.planners["incremental"] = solvers.IncrementalPlanner(gui.model)
+
+    result = planner.query(start.index, end.index, observer=gui.showStep)
+    gui.play()
+    if result:
+        end.setState("end point")
+        start.setState("start point")
+    return result.found
@@ -0,0 +1,25 @@
+from node import Node
+from gui import Gui
+import solvers
+
+
+def jumpPointSearch(gui:Gui, start:Node, end:Node) -> bool:
+    """Runs Jump Point Search algorithm on the window, drawing every step of the search
+
+    See "solvers.jumpPointSearch" for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    start : Node
+        The starting point
+    end : Node
+        The ending point
+
+    Returns
+    -------
+    bool
+        True if the ending node was reached, else False
+    """
+    return gui.solve(solvers.jumpPointSearch, start, end).found
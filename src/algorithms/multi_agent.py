@@ -0,0 +1,42 @@
+from gui import Gui
+import solvers
+
+
+def cooperativeAStar(gui:Gui, agents:list) -> list:
+    """Plans collision-free paths for many agents on the window, then draws them moving together
+
+    Every time step draws the agents at their cells, leaving their trails behind. The planner
+    is created on the first run and kept in "gui.planners", so the following runs reuse the
+    distances to the goals while the walls do not change. See "solvers.CooperativePlanner"
+    for the headless version.
+
+    Parameters
+    ----------
+    gui : Gui
+        The user interface holding the nodes
+    agents : list
+        The (start, end) nodes of every agent
+
+    Returns
+    -------
+    list
+        Whether each agent reached its ending node
+    """
+    planner = gui.planners.get("cooperative")
+    if planner is None:
+        planner = gui.planners["cooperative"] = solvers.CooperativePlanner(gui.model)
+
+    results = planner.plan([(start.index, end.index) for start, end in agents])
+    paths = [result.path for result in results]
+    for start, end in agents:
+        gui.showStep(start.index, "start point")
+        gui.showStep(end.index, "end point")
+    for time in range(1, max(map(len, paths), default=0)):
+        for path in paths:
+            if time < len(path) and path[time] != path[time - 1]:
+                gui.showStep(path[time - 1], "path")
+        for path in paths:
+            if time < len(path):
+                gui.showStep(path[time], "start point")
+    gui.play()
+    return [result.found for result in results]
@@ -0,0 +1,184 @@
+import argparse
+import os
+from functools import partial
+import random
+import tracemalloc
+from grid import Grid, TOPOLOGIES
+from maze_generator import generators
+from maps import loadMap, loadScenarios
+import solvers
+from solvers import pathCost, Profiler, JsonLinesWriter, labelComponents
+
+
+# Mapping the names that can be benchmarked to the headless solvers
+algorithms = {
+    "aStar": solvers.aStar,
+    "depthFirst": solvers.depthFirst,
+    "breadthFirstSearch": solvers.breadthFirstSearch,
+    "dijkstra": solvers.dijkstra,
+    "jumpPointSearch": solvers.jumpPointSearch,
+    "thetaStar": solvers.thetaStar,
+    "lazyThetaStar": solvers.lazyThetaStar,
+    "bidirectionalAStar": solvers.bidirectionalAStar,
+    "bidirectionalBreadthFirstSearch": solvers.bidirectionalBreadthFirstSearch,
+}
+
+
+def buildMap(size:int, seed:int, density:float = 0.25, topology:str = "square4", maze:str = "random",
+             max_cost:int = 1) -> tuple:
+    """Builds a square map with a seeded maze generator
+
+    Parameters
+    ----------
+    size : int
+        Amount of rows and columns of the map
+    seed : int
+        The seed of the generator, the same seed always gives the same map
+    density : float, optional
+        The probability of a cell being a wall, only used by the "random" generator, by default 0.25
+    topology : str, optional
+        The topology of the grid, by default "square4"
+    maze : str, optional
+        A name of "maze_generator.generators", by default "random"
+    max_cost : int, optional
+        The terrain costs are drawn uniformly from 1 to it, by default 1 for no cost layer
+
+    Returns
+    -------
+    tuple
+        The grid, the starting cell and the ending cell: the first and the last cell of
+        the largest region of open cells, so a path always joins them
+    """
+    import numpy as np
+
+    grid = Grid(size, size, topology)
+    if maze == "random":
+        generators[maze](grid, density, seed=seed)
+    else:
+        generators[maze](grid, seed=seed)
+
+    labels = labelComponents(grid)
+    region = np.flatnonzero(labels == np.bincount(labels[labels >= 0]).argmax())
+    start, end = int(region[0]), int(region[-1])
+
+    if max_cost > 1:
+        rnd = random.Random(seed)
+        grid.costs = bytearray(rnd.randrange(max_cost) + 1 for _ in range(len(grid)))
+        grid.notifyWalls()
+    return grid, start, end
+
+
+def run(search, grid:Grid, start:int, end:int) -> tuple:
+    """Runs a search twice, first for timing and then tracing the memory allocations
+
+    Parameters
+    ----------
+    search : callable
+        The headless solver
+    grid : Grid
+        The map to be searched
+    start : int
+        The starting cell
+    end : int
+        The ending cell
+
+    Returns
+    -------
+    tuple
+        The search result and the peak of allocated memory in bytes
+    """
+    result = search(grid, start, end)
+
+    tracemalloc.start()
+    search(grid, start, end)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def runScenarios(path:str, names:list, map_path:str = None, profiler:Profiler = None) -> None:
+    """Runs some solvers on every problem of a MovingAI scenario file and prints their totals
+
+    Parameters
+    ----------
+    path : str
+        The scenario file path
+    names : list
+        The names of the algorithms to run
+    map_path : str, optional
+        The map file path, by default the map named by the scenarios, next to the scenario file
+    profiler : Profiler, optional
+        Records every search, by default None
+    """
+    problems = loadScenarios(path)
+    if not problems:
+        raise AttributeError(f'The scenario file "{path}" has no problems')
+    if map_path is None:
+        map_path = os.path.join(os.path.dirname(path), os.path.basename(problems[0][0]))
+    grid = loadMap(map_path)
+
+    header = f'{"algorithm":<34}{"problems":>9}{"found":>7}{"optimal":>9}{"expanded":>12}{"time (s)":>10}{"nodes/s":>12}'
+    print(header)
+    print("-" * len(header))
+    for name in names:
+        found = optimal = expanded = 0
+        elapsed = 0.0
+        try:
+            search = algorithms[name] if profiler is None else partial(profiler.run, algorithms[name])
+            results = [(search(grid, start, end), length) for _, start, end, length in problems]
+        except AttributeError as error: # The algorithm does not support the topology or the corner rule of the map
+            print(f'{name:<34}{error}')
+            continue
+        for result, length in results:
+            found += result.found
+            optimal += result.found and abs(pathCost(grid, result.path) - length) < 1e-3
+            expanded += result.expanded
+            elapsed += result.elapsed
+        rate = expanded / elapsed if elapsed else float("inf")
+        print(
+            f'{name:<34}{len(problems):>9}{found:>7}{optimal:>9}{expanded:>12}'
+            f'{elapsed:>10.3f}{rate:>12,.0f}'
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the headless solvers on seeded generated maps or MovingAI scenarios")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128, 256, 512, 1024, 2048],
+                        help="The side lengths of the maps")
+    parser.add_argument("--algorithms", nargs="+", choices=algorithms.keys(), default=list(algorithms.keys()),
+                        help="The algorithms to run")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the maps")
+    parser.add_argument("--density", type=float, default=0.25, help="The probability of a cell being a wall")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="square4", help="The movement rule of the maps")
+    parser.add_argument("--maze", choices=generators.keys(), default="random", help="The generator of the maps")
+    parser.add_argument("--max-cost", type=int, default=1, help="The highest terrain cost of the cells")
+    parser.add_argument("--scenario", help="A MovingAI scenario file to run instead of the generated maps")
+    parser.add_argument("--map", help="The map of the scenario file, by default the one it names")
+    parser.add_argument("--jsonl", help="A file the metrics of every search are appended to, as JSON lines")
+    args = parser.parse_args()
+
+    profiler = Profiler([JsonLinesWriter(args.jsonl)] if args.jsonl else [])
+    if args.scenario:
+        runScenarios(args.scenario, args.algorithms, args.map, profiler)
+        return
+
+    header = f'{"algorithm":<34}{"size":>7}{"found":>7}{"length":>8}{"expanded":>10}{"time (s)":>10}{"nodes/s":>12}{"peak (MB)":>11}'
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        grid, start, end = buildMap(size, args.seed, args.density, args.topology, args.maze, args.max_cost)
+        for name in args.algorithms:
+            try:
+                result, peak = run(algorithms[name], grid, start, end)
+            except AttributeError as error: # The algorithm does not support the topology of the map
+                print(f'{name:<34}{error}')
+                continue
+            profiler.record(algorithms[name], grid, start, end, result, peak)
+            rate = result.expanded / result.elapsed if result.elapsed else float("inf")
+            print(
+                f'{name:<34}{size:>7}{str(result.found):>7}{len(result.path):>8}{result.expanded:>10}'
+                f'{result.elapsed:>10.3f}{rate:>12,.0f}{peak / 2**20:>11.1f}'
+            )
+
+if __name__ == '__main__':
+    main()
@@ -10,4 +10,5 @@ GRAY = (105, 105, 105)
 PURPLE = (128, 0, 128)
 ORANGE = (255, 165 ,0)
 GREY = (128, 128, 128)
-TURQUOISE = (64, 224, 208)
\ No newline at end of file
+TURQUOISE = (64, 224, 208)
+BROWN = (139, 69, 19)
\ No newline at end of file
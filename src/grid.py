@@ -0,0 +1,365 @@
+
+from topology import SQRT2, TOPOLOGIES, CORNER_RULES, deltaTable, cornerBlocked
+
+
+# Integer codes of the cell states, stored one byte per cell
+EMPTY, WALL, START, END, PATH, VISITED, WATCH = range(7)
+STATES = ("empty", "wall", "start point", "end point", "path", "visited", "watch")
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+# The highest cost of entering a cell, costs are stored one byte per cell
+MAX_COST = 255
+
+
+class Grid(object):
+    def __init__(self, rows:int, cols:int, topology:str = "square4", cells = None, costs = None,
+                 corner_rule:str = "cut") -> None:
+        """A plain grid model that the solvers run against, without any pygame dependency
+
+        Cells are addressed by integer indices (row * cols + col), matching the
+        order in which the nodes are stored in "Gui.grid". The state of every cell
+        is kept as an integer code in a flat bytearray, so a 4096x4096 grid takes 16 MB.
+
+        Parameters
+        ----------
+        rows : int
+            Amount of vertical cells
+        cols : int
+            Amount of horizontal cells
+        topology : str, optional
+            The movement rule, one of "TOPOLOGIES", by default "square4".
+            "square4" moves horizontally and vertically, "square8" also moves diagonally
+            and "hex" follows hexagons whose odd columns are shifted half a cell down
+        cells : bytearray or memoryview, optional
+            An existing writable buffer starting with rows * cols state codes, used without
+            copying (e.g. shared or memory-mapped memory), by default a new empty one
+        costs : bytearray or memoryview, optional
+            An existing writable buffer starting with rows * cols costs of entering each cell,
+            from 1 to "MAX_COST", used without copying, by default None for unit costs
+        corner_rule : str, optional
+            The rule for diagonal moves beside walls on "square8" grids, one of
+            "topology.CORNER_RULES", by default "cut" (always allowed)
+        """
+        self.rows = rows
+        self.cols = cols
+        self.setTopology(topology, corner_rule, notify=False)
+        if cells is None:
+            cells = bytearray(rows * cols)
+        elif len(cells) < rows * cols:
+            raise AttributeError(f'The cells buffer has {len(cells)} bytes, expected at least {rows * cols}')
+        if costs is not None and len(costs) < rows * cols:
+            raise AttributeError(f'The costs buffer has {len(costs)} bytes, expected at least {rows * cols}')
+        self.cells = cells
+        self.costs = costs # Allocated by the first "setCost", None while every cell costs 1
+        self.revision = 0 # Bumped on every wall or cost change
+        self.wall_listeners = []
+        self.components = None # A "solvers.ComponentIndex" rejecting the unreachable queries, attached by its constructor
+
+    def __len__(self) -> int:
+        return self.rows * self.cols
+
+    def setTopology(self, topology:str, corner_rule:str = "cut", notify:bool = True) -> None:
+        """Changes the movement rule, precomputing the index deltas of the moves of each column parity
+
+        Parameters
+        ----------
+        topology : str
+            The movement rule, one of "TOPOLOGIES"
+        corner_rule : str, optional
+            The rule for diagonal moves beside walls, one of "CORNER_RULES", by default "cut"
+        notify : bool, optional
+            Whether to notify the wall listeners, the adjacency of every cell having changed, by default True
+        """
+        if topology not in TOPOLOGIES:
+            raise AttributeError(
+                f'The topology "{topology}" has not been defined in "grid.TOPOLOGIES".\n' +
+                f'Topologies currently defined: {TOPOLOGIES}'
+            )
+        if corner_rule not in CORNER_RULES:
+            raise AttributeError(
+                f'The corner rule "{corner_rule}" has not been defined in "topology.CORNER_RULES".\n' +
+                f'Corner rules currently defined: {CORNER_RULES}'
+            )
+
+        self.topology = topology
+        self.corner_rule = corner_rule
+        self.moves = (deltaTable(topology, 0, self.cols), deltaTable(topology, 1, self.cols))
+        # Inner cells have every move inside the grid, and without corner checks only the deltas matter
+        if topology == "square8" and corner_rule != "cut":
+            self.inner_deltas = self.inner_steps = None
+        else:
+            self.inner_deltas = tuple(tuple(move[2] for move in moves) for moves in self.moves)
+            self.inner_steps = tuple(tuple((move[2], move[3]) for move in moves) for moves in self.moves)
+        if notify:
+            self.notifyWalls()
+
+    def index(self, row:int, col:int) -> int:
+        """Gets the index of the cell at the given row and column
+
+        Parameters
+        ----------
+        row : int
+            The row of the cell
+        col : int
+            The column of the cell
+
+        Returns
+        -------
+        int
+            The cell index
+        """
+        return (row * self.cols) + col
+
+    def coords(self, idx:int) -> tuple:
+        """Gets the row and column of a cell
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        tuple
+            The row and column of the cell
+        """
+        return divmod(idx, self.cols)
+
+    def isWall(self, idx:int) -> bool:
+        """Indicates whether a cell is blocked
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        bool
+            True, if the cell is a wall
+        """
+        return self.cells[idx] == WALL
+
+    def setWall(self, idx:int, wall:bool = True) -> None:
+        """Blocks or unblocks a cell
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+        wall : bool, optional
+            Whether the cell becomes a wall, by default True
+        """
+        self.setCode(idx, WALL if wall else EMPTY)
+
+    def getState(self, idx:int) -> str:
+        """Gets the state of a cell
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        str
+            The state name, as defined in "STATES"
+        """
+        return STATES[self.cells[idx]]
+
+    def setState(self, idx:int, state:str) -> None:
+        """Sets the state of a cell
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+        state : str
+            The state name, as defined in "STATES"
+        """
+        self.setCode(idx, STATE_CODES[state])
+
+    def setCode(self, idx:int, code:int) -> None:
+        """Sets the integer state code of a cell, notifying the wall listeners
+        when the cell becomes or stops being a wall
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+        code : int
+            The state code
+        """
+        cells = self.cells
+        was_wall = cells[idx] == WALL
+        cells[idx] = code
+        if was_wall != (code == WALL):
+            self.notifyWalls(idx)
+
+    def getCost(self, idx:int) -> int:
+        """Gets the cost of entering a cell
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        int
+            The cost, 1 for plain cells
+        """
+        return 1 if self.costs is None else self.costs[idx]
+
+    def setCost(self, idx:int, cost:int) -> None:
+        """Sets the cost of entering a cell, notifying the wall listeners when it changes
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+        cost : int
+            The cost, from 1 to "MAX_COST"
+        """
+        if not 1 <= cost <= MAX_COST:
+            raise AttributeError(f'The cost {cost} is out of the range [1, {MAX_COST}]')
+
+        if self.getCost(idx) == cost:
+            return
+        if self.costs is None:
+            self.costs = bytearray(b"\x01") * len(self)
+        self.costs[idx] = cost
+        self.notifyWalls(idx)
+
+    def clearCosts(self) -> None:
+        """Resets the cost of every cell to 1
+        """
+        if self.costs is not None:
+            self.costs = None
+            self.notifyWalls()
+
+    def clear(self, keep:tuple = ()) -> None:
+        """Empties every cell at once, except the ones in some states
+
+        Parameters
+        ----------
+        keep : tuple, optional
+            The state codes left untouched, by default () for emptying the whole grid
+        """
+        size = len(self)
+        current = bytes(self.cells[:size])
+        table = bytes(code if code in keep else EMPTY for code in range(256))
+        self.cells[:size] = current.translate(table)
+        if WALL not in keep and WALL in current:
+            self.notifyWalls()
+
+    def addWallListener(self, listener) -> None:
+        """Registers a callable to be notified whenever the walls or the costs change
+
+        Parameters
+        ----------
+        listener : callable
+            Receives the index of the cell that became or stopped being a wall or whose
+            cost changed, or None when many cells were rewritten at once
+        """
+        self.wall_listeners.append(listener)
+
+    def removeWallListener(self, listener) -> None:
+        """Unregisters a callable added through "addWallListener"
+
+        Parameters
+        ----------
+        listener : callable
+            The registered callable
+        """
+        self.wall_listeners.remove(listener)
+
+    def notifyWalls(self, idx:int = None) -> None:
+        """Bumps the revision and notifies the wall listeners about a change
+
+        Code writing straight into "cells" or "costs" must call it with None afterwards.
+
+        Parameters
+        ----------
+        idx : int, optional
+            The cell that changed, by default None for many cells
+        """
+        self.revision += 1
+        for listener in self.wall_listeners:
+            listener(idx)
+
+    def neighbors(self, idx:int) -> list:
+        """Seeks for the adjacent cells that are not walls
+
+        The neighbors are computed on demand from the move tables of the topology and the
+        current walls, so editing a wall never requires rebuilding any adjacency.
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        list
+            The indices of the adjacent open cells
+        """
+        cols, cells = self.cols, self.cells
+        row, col = divmod(idx, cols)
+        if self.inner_deltas and 0 < row < self.rows-1 and 0 < col < cols-1:
+            # Every move stays inside the grid
+            return [idx + delta for delta in self.inner_deltas[col & 1] if cells[idx + delta] != WALL]
+        return [neighbor for neighbor, _ in self.steps(idx)]
+
+    def steps(self, idx:int) -> list:
+        """Seeks for the adjacent cells that are not walls, along with the length of the move to them
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        list
+            The (neighbor index, length) pairs, the length being sqrt(2) for diagonal moves else 1
+        """
+        cols, rows, cells = self.cols, self.rows, self.cells
+        row, col = divmod(idx, cols)
+        if self.inner_steps and 0 < row < rows-1 and 0 < col < cols-1:
+            # Every move stays inside the grid
+            return [(idx + delta, cost) for delta, cost in self.inner_steps[col & 1] if cells[idx + delta] != WALL]
+
+        corner_rule = self.corner_rule
+        result = []
+        for d_row, d_col, delta, cost, corners in self.moves[col & 1]:
+            if not (0 <= row + d_row < rows and 0 <= col + d_col < cols):
+                continue
+            neighbor = idx + delta
+            if cells[neighbor] == WALL:
+                continue
+            if corners and cornerBlocked(corner_rule, cells[idx + corners[0]] == WALL, cells[idx + corners[1]] == WALL):
+                continue
+            result.append((neighbor, cost))
+        return result
+
+    def moveCost(self, a:int, b:int) -> float:
+        """Gets the cost of moving between two adjacent cells
+
+        Parameters
+        ----------
+        a : int
+            The cell left
+        b : int
+            The cell entered
+
+        Returns
+        -------
+        float
+            The cost of entering the second cell, times sqrt(2) for diagonal moves
+        """
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        if self.topology == "square8" and a_row != b_row and a_col != b_col:
+            return SQRT2 * self.getCost(b)
+        return self.getCost(b)
@@ -1,12 +1,21 @@
 import pygame
+from array import array
+from time import perf_counter
 from node import Node, Square, Hexagon
+from grid import Grid, EMPTY, VISITED, STATES, STATE_CODES
+from solvers import PathCache, SearchResult, Profiler, ComponentIndex
+from maps import loadMap, saveBinaryMap
 import colors
 
 class Gui(object):
     """A class that handles the user interface
     """
+    max_dirty_rects = 512 # Above this amount of drawn areas, the whole window is updated at once
+    skip_key = pygame.K_s # Draws the rest of a search at once
+    hud_font_size = 20
 
-    def __init__(self, width = 1000, height = 700, padding = (0, 0, 0, 0), gap = 1, node_size = 25, fps = 120):
+    def __init__(self, width = 1000, height = 700, padding = (0, 0, 0, 0), gap = 1, node_size = 25, fps = 120,
+                 steps_per_frame = None, frame_budget = 0.005):
         """Class constructor
 
         Parameters
@@ -23,21 +32,40 @@ class Gui(object):
             The size of the node, by default 25
         fps : int, optional
             The amount of frames per second, by default 120
+        steps_per_frame : int, optional
+            The amount of search steps drawn per frame, by default as many as fit in "frame_budget"
+        frame_budget : float, optional
+            The maximum time in seconds spent drawing search steps per frame, by default 0.005
         """
         pygame.init()
         self.window = pygame.display.set_mode((width, height))
         pygame.display.set_caption('Gui')
         self.fps = fps
         self.clock = pygame.time.Clock()
+        self.steps_per_frame = steps_per_frame
+        self.frame_budget = frame_budget
+        # The steps recorded by "showStep" and not drawn yet, as cell indices and state codes
+        self.step_cells = array("l")
+        self.step_codes = bytearray()
 
         self.padding = padding
 
         self.grid = []
+        self.planners = {} # Planners that keep their state between searches, by name
         self.gap = gap
         self.window.fill(colors.GREY)
         Node.size = node_size
         self.drawNodes()
         self.drawBorders()
+        self.path_cache = PathCache(self.model)
+        self.components = ComponentIndex(self.model) # Rejects the unreachable queries before searching
+        self.full_update = True # Whether the next update must push the whole window
+        self.gap_mask = None # The gaps between the nodes, drawn over the cells by "blitGrid"
+        self.brush_cost = 1 # The cost painted by "setNodeColor", 1 paints walls instead
+        self.profiler = Profiler() # Records every search, sinks can be added to export the records
+        self.show_hud = False # Whether the counters of the last search are drawn over the nodes
+        self.hud_rect = None # The area covered by the counters
+        self.hud_progress = None # The expanded nodes drawn so far while a search is played
         
 
     def drawNodes(self) -> None:
@@ -57,9 +85,13 @@ class Gui(object):
         x0 = (self.window.get_width() - (self.horizontal_nodes * partition)) // 2
         y0 = (self.window.get_height() - (self.vertical_nodes * partition)) // 2
 
-        # Generating the nodes
+        # Generating the grid model and the nodes viewing its cells
+        self.node_type = Square
+        self.partition = partition
+        self.origin = (x0, y0)
+        self.model = Grid(self.vertical_nodes, self.horizontal_nodes, self.node_type.topology)
         self.grid = [
-            Square(row, col, partition, x0, y0, self.window)
+            self.node_type(self.model, row, col, partition, x0, y0, self.window)
             for row in range(self.vertical_nodes) for col in range(self.horizontal_nodes)
         ]
     
@@ -76,8 +108,72 @@ class Gui(object):
         pygame.draw.lines( self.window, color, closed=True, points=points , width=width)
         
 
-    def setNodeColor(self, mouse_xy:tuple, start_node:Node, end_node:Node) -> tuple:
-        """Seeks for the node that the mouse clicked on and changes its color
+    def setTopology(self, topology:str, corner_rule:str = "cut") -> None:
+        """Changes the movement rule of the grid, dropping the planners built for the previous one
+
+        Parameters
+        ----------
+        topology : str
+            The movement rule, one of "grid.TOPOLOGIES" drawable by the nodes
+        corner_rule : str, optional
+            The rule for diagonal moves beside walls, one of "topology.CORNER_RULES", by default "cut"
+        """
+        for planner in self.planners.values():
+            planner.close()
+        self.planners.clear()
+        self.model.setTopology(topology, corner_rule)
+
+    def nodeAt(self, mouse_xy:tuple) -> Node:
+        """Gets the node under a pixel coordinate, computed from the layout of the nodes
+
+        Parameters
+        ----------
+        mouse_xy : tuple
+            The mouse horizontal and vertical pixel values
+
+        Returns
+        -------
+        Node
+            The node, or None if the coordinate is out of the grid
+        """
+        row, col = self.node_type.locate(*mouse_xy, self.partition, *self.origin)
+        if 0 <= row < self.vertical_nodes and 0 <= col < self.horizontal_nodes:
+            return self.grid[self.model.index(row, col)]
+        return None
+
+    def nodesBetween(self, previous_xy:tuple, mouse_xy:tuple) -> list:
+        """Gets the nodes crossed by the mouse between two positions, so fast drags skip none
+
+        Parameters
+        ----------
+        previous_xy : tuple
+            The previous mouse horizontal and vertical pixel values, None for a single position
+        mouse_xy : tuple
+            The current mouse horizontal and vertical pixel values
+
+        Returns
+        -------
+        list
+            The nodes in the order they were crossed, without repetition
+        """
+        if previous_xy is None:
+            previous_xy = mouse_xy
+        (x0, y0), (x1, y1) = previous_xy, mouse_xy
+        # Sampling the segment at least twice per node
+        samples = max(1, int(2 * max(abs(x1 - x0), abs(y1 - y0)) / self.partition))
+        nodes, seen = [], set()
+        for i in range(samples + 1):
+            node = self.nodeAt((x0 + (x1 - x0) * i / samples, y0 + (y1 - y0) * i / samples))
+            if node is not None and node not in seen:
+                seen.add(node)
+                nodes.append(node)
+        return nodes
+
+    def setNodeColor(self, mouse_xy:tuple, start_node:Node, end_node:Node, previous_xy:tuple = None) -> tuple:
+        """Seeks for the nodes that the mouse clicked on or dragged over and changes their color
+
+        Once the starting and ending points are set, the nodes become walls, or get
+        "brush_cost" as terrain cost when it is above 1.
 
         Parameters
         ----------
@@ -87,28 +183,32 @@ class Gui(object):
             The node that it's already setted as the start node
         end_node : Node
             The node that it's already setted as the end node
+        previous_xy : tuple, optional
+            The mouse position of the previous event while dragging, by default None
 
         Returns
         -------
         tuple
             The starting and ending nodes
         """
-        for node in self.grid:
-            if node.isCoordinateIn(*mouse_xy):
-                if not start_node:
-                    node.setState("start point")
-                    start_node = node
-                elif not end_node and node != start_node:
-                    node.setState("end point")
-                    end_node = node
-                elif node != end_node and node != start_node:
-                    node.setState("wall")  
-                break  
+        for node in self.nodesBetween(previous_xy, mouse_xy):
+            if not start_node:
+                node.setState("start point")
+                start_node = node
+            elif not end_node and node != start_node:
+                node.setState("end point")
+                end_node = node
+            elif node != end_node and node != start_node:
+                if self.brush_cost > 1:
+                    node.setState("empty")
+                    node.setCost(self.brush_cost)
+                else:
+                    node.setState("wall")
 
         return start_node, end_node
                 
-    def resetNodeColor(self, mouse_xy:tuple, start_node:Node, end_node:Node) -> tuple:
-        """Seeks for the node that the mouse clicked on and resets its color
+    def resetNodeColor(self, mouse_xy:tuple, start_node:Node, end_node:Node, previous_xy:tuple = None) -> tuple:
+        """Seeks for the nodes that the mouse clicked on or dragged over and resets their color
 
         Parameters
         ----------
@@ -118,42 +218,285 @@ class Gui(object):
             The node that it's already setted as the start node
         end_node : Node
             The node that it's already setted as the end node
+        previous_xy : tuple, optional
+            The mouse position of the previous event while dragging, by default None
 
         Returns
         -------
         tuple
             The starting and ending nodes
         """
-        for node in self.grid:
-            if node.isCoordinateIn(*mouse_xy):
-                node.setState("empty")
-                if node == start_node:
-                    start_node = None
-                if node == end_node:
-                    end_node = None
-                break
+        for node in self.nodesBetween(previous_xy, mouse_xy):
+            node.setCost(1)
+            node.setState("empty")
+            if node == start_node:
+                start_node = None
+            if node == end_node:
+                end_node = None
         return start_node, end_node
     
 
-    def updateNodeNeighbors(self) -> None:
-        """Updates all the neighbors of each node
+    def solve(self, search, start:Node, end:Node) -> SearchResult:
+        """Runs a headless solver on the window, then draws every step of the search
+
+        A query repeated with the same walls is answered by "path_cache",
+        drawing the path only. The statistics are recorded by "profiler".
+
+        Parameters
+        ----------
+        search : callable
+            The solver, e.g. "solvers.aStar"
+        start : Node
+            The starting point
+        end : Node
+            The ending point
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics
+        """
+        result = self.path_cache.solve(search, start.index, end.index, observer=self.showStep)
+        self.profiler.record(search, self.model, start.index, end.index, result)
+        self.play()
+        if result:
+            end.setState("end point")
+            start.setState("start point")
+        return result
+
+    def showStep(self, cell:int, state:str) -> None:
+        """Observes a solver step, recording it to be drawn by "play"
+
+        The search runs at full speed, the drawing being done afterwards at its own pace.
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+        state : str
+            The new state of the cell
+        """
+        self.step_cells.append(cell)
+        self.step_codes.append(STATE_CODES[state])
+
+    def play(self) -> None:
+        """Draws the recorded steps of a search, a limited amount per frame
+
+        Every frame draws "steps_per_frame" steps, stopping earlier when "frame_budget" runs out,
+        so the window keeps responding however long the search is. Pressing "skip_key" draws
+        the remaining steps at once.
+        """
+        cells, codes = self.step_cells, self.step_codes
+        self.step_cells, self.step_codes = array("l"), bytearray()
+        position, total = 0, len(cells)
+        while position < total:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.close()
+                if event.type == pygame.KEYDOWN and event.key == self.skip_key:
+                    # Writing the remaining states without drawing them, then drawing the window once
+                    for cell, code in zip(cells[position:], codes[position:]):
+                        self.model.setCode(cell, code)
+                    self.redraw()
+                    position = total
+
+            stop = min(total, position + (self.steps_per_frame or total))
+            deadline = perf_counter() + self.frame_budget
+            while position < stop:
+                self.grid[cells[position]].setState(STATES[codes[position]])
+                position += 1
+                if perf_counter() >= deadline:
+                    break
+            if self.show_hud:
+                self.hud_progress = codes[:position].count(VISITED)
+            self.updateContents()
+        self.hud_progress = None
+
+    def toggleHud(self) -> None:
+        """Shows or hides the counters of the last search over the nodes
+        """
+        self.show_hud = not self.show_hud
+        if self.show_hud:
+            self.drawHud()
+        else:
+            self.redraw()
+
+    def drawHud(self) -> None:
+        """Draws the counters of the last search (see "Profiler.record") on the top left corner of the grid
+
+        While a search is played, the expanded nodes drawn so far are shown along with the total.
         """
-        for node in self.grid:
-            node.updateNeighbors(self.grid, self.horizontal_nodes, self.vertical_nodes)
+        record = self.profiler.last
+        if record is None:
+            lines = ["no search yet"]
+        else:
+            expanded = str(record["expanded"])
+            if self.hud_progress is not None:
+                expanded = f'{self.hud_progress} / {expanded}'
+            lines = [
+                f'{record["algorithm"]}: {"found" if record["found"] else "not found"}',
+                f'expanded: {expanded}',
+                f'pushes / pops: {self.counter(record["pushes"])} / {self.counter(record["pops"])}',
+                f'peak open set: {self.counter(record["peak_open"])}',
+                f'path: {record["length"]} cells, cost {record["cost"]:.1f}',
+                f'time: {record["elapsed"] * 1000:.1f} ms',
+            ]
+
+        font = pygame.font.Font(None, self.hud_font_size)
+        texts = [font.render(line, True, colors.WHITE) for line in lines]
+        margin = 4
+        width = max(text.get_width() for text in texts) + (2 * margin)
+        height = sum(text.get_height() for text in texts) + (2 * margin)
+        rect = pygame.Rect(self.grid[0].x0, self.grid[0].y0, width, height)
+        if self.hud_rect and not rect.contains(self.hud_rect):
+            # The counters shrank, the nodes left uncovered are drawn again
+            self.redraw()
+        self.window.fill(colors.BLACK, rect)
+        y = rect.y + margin
+        for text in texts:
+            self.window.blit(text, (rect.x + margin, y))
+            y += text.get_height()
+        self.hud_rect = rect
+        Node.dirty_rects.append(rect)
+
+    @staticmethod
+    def counter(value:int) -> str:
+        """Formats a counter that a solver may not report
+
+        Parameters
+        ----------
+        value : int
+            The counter, None if not reported
 
+        Returns
+        -------
+        str
+            The value, "-" if not reported
+        """
+        return "-" if value is None else str(value)
 
     def updateContents(self) -> None:
-        """Updates the window content
+        """Updates the window content, once per frame
+
+        Only the areas of the nodes drawn since the last update are pushed to the display,
+        unless there are too many of them or the whole window was redrawn.
         """
         self.clock.tick(self.fps)
-        pygame.display.flip()
+        dirty_rects = Node.dirty_rects
+        if self.show_hud and dirty_rects:
+            self.drawHud() # Nodes may have been drawn over the counters
+        if self.full_update or len(dirty_rects) > self.max_dirty_rects:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        dirty_rects.clear()
+        self.full_update = False
     
+    def redraw(self) -> None:
+        """Draws every node again, after its cells were changed without drawing (e.g. by a maze generator)
+        """
+        if isinstance(self.grid[0], Square):
+            self.blitGrid()
+        else:
+            for node in self.grid:
+                node.draw()
+        self.hud_rect = None
+        if self.show_hud:
+            self.drawHud()
+        self.full_update = True
+
+    def blitGrid(self) -> None:
+        """Draws all the square nodes at once from the grid buffer
+
+        The state codes are copied into an 8-bit surface, one pixel per cell, whose palette
+        maps every code to the color of its state. The surface is then scaled to the node
+        size, covered by the gaps between the nodes and blitted to the window.
+
+        With terrain costs, the pixel of a cell also holds its shade in the bits above the
+        state code, and the palette shades the empty cells.
+        """
+        rows, cols, size = self.model.rows, self.model.cols, len(self.model)
+        partition = Node.size + self.gap
+        surface = pygame.Surface((cols, rows), depth=8)
+        palette = []
+        for pixel in range(256):
+            code, shade = pixel & 7, pixel >> 3
+            if code == EMPTY:
+                palette.append(Node.getTerrainColor(min(shade, Node.terrain_shades)))
+            else:
+                palette.append(Node.state_color_map[STATES[code]] if code < len(STATES) else colors.BLACK)
+        surface.set_palette(palette)
+
+        cells = bytes(self.model.cells[:size])
+        if self.model.costs is not None:
+            # Joining every state code with the shade of the cell, a byte-wise OR done on whole integers
+            table = bytes(Node.terrainShade(max(cost, 1)) << 3 for cost in range(256))
+            shades = bytes(self.model.costs[:size]).translate(table)
+            cells = (int.from_bytes(cells, "little") | int.from_bytes(shades, "little")).to_bytes(size, "little")
+
+        buffer, pitch = surface.get_buffer(), surface.get_pitch()
+        for row in range(rows):
+            buffer.write(bytes(cells[row * cols:(row + 1) * cols]), row * pitch)
+        del buffer # Unlocking the surface
+
+        size = (cols * partition, rows * partition)
+        if self.gap and self.gap_mask is None:
+            self.gap_mask = pygame.Surface(size, pygame.SRCALPHA)
+            for col in range(cols):
+                self.gap_mask.fill(colors.GREY, (col * partition + Node.size, 0, self.gap, size[1]))
+            for row in range(rows):
+                self.gap_mask.fill(colors.GREY, (0, row * partition + Node.size, size[0], self.gap))
+
+        origin = (self.grid[0].x0, self.grid[0].y0)
+        self.window.blit(pygame.transform.scale(surface, size), origin)
+        if self.gap_mask:
+            self.window.blit(self.gap_mask, origin)
+        self.drawBorders()
+
     def reset(self, exeptions=[]) -> None:
-        """Resets the contents of the window
+        """Resets the contents of the window, the terrain costs being kept along with the walls
         """
-        nodes = filter(lambda node: node.state not in exeptions, self.grid)
-        for node in nodes:
-            node.setState("empty")
+        self.model.clear(keep=[STATE_CODES[state] for state in exeptions])
+        if "wall" not in exeptions:
+            self.model.clearCosts()
+        self.redraw()
+
+    def saveMap(self, path:str) -> None:
+        """Saves the walls and terrain costs of the window to a binary map
+
+        Parameters
+        ----------
+        path : str
+            The file path
+        """
+        saveBinaryMap(self.model, path)
+
+    def loadMap(self, path:str) -> None:
+        """Replaces the contents of the window with a map file (see "maps.loadMap")
+
+        The window keeps its size and topology: the map is cropped to the nodes available,
+        and the nodes outside it are left empty.
+
+        Parameters
+        ----------
+        path : str
+            The file path
+        """
+        loaded = loadMap(path)
+        model = self.model
+        model.clear()
+        model.costs = None
+        rows, cols = min(model.rows, loaded.rows), min(model.cols, loaded.cols)
+        if loaded.costs is not None:
+            model.costs = bytearray(b"\x01") * len(model)
+        for row in range(rows):
+            # Copying the overlapping part of each row at once
+            target, source = model.index(row, 0), loaded.index(row, 0)
+            model.cells[target:target + cols] = loaded.cells[source:source + cols]
+            if loaded.costs is not None:
+                model.costs[target:target + cols] = loaded.costs[source:source + cols]
+        model.notifyWalls()
+        self.redraw()
 
     def close(self) -> None:
         """Closes the pygame window
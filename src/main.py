@@ -1,22 +1,46 @@
+import os
+import random
 import pygame
 from gui import Gui
-from algorithms import aStar, depthFirst, breadthFirstSearch
+from algorithms import aStar, depthFirst, breadthFirstSearch, dijkstra, jumpPointSearch, thetaStar, lazyThetaStar
+from algorithms import bidirectionalAStar, bidirectionalBreadthFirstSearch, hierarchicalAStar, incrementalAStar
+from algorithms import cooperativeAStar
+from maze_generator import primsAlgorithm, recursiveBacktracker, randomFill
 
 
 def main():
     gui_fps = 120
-    path_finding_fps = 30
+    path_finding_seconds = 4 # About how long drawing a search over the whole grid takes, whatever its size
     gui = Gui(fps = gui_fps)
+    gui.steps_per_frame = max(1, len(gui.grid) // (path_finding_seconds * gui_fps))
+    map_path = "maze.grid" # The binary map written and read by the "w" and "r" keys
+    agent_count = 20 # The agents sent between random points by the "g" key
 
     # Mapping the keys that triggers an algorithm initialization
     search_mapping = {
         pygame.K_a: aStar,
         pygame.K_d: depthFirst,
         pygame.K_b: breadthFirstSearch,
+        pygame.K_k: dijkstra,
+        pygame.K_j: jumpPointSearch,
+        pygame.K_y: thetaStar,
+        pygame.K_u: lazyThetaStar,
+        pygame.K_x: bidirectionalAStar,
+        pygame.K_z: bidirectionalBreadthFirstSearch,
+        pygame.K_h: hierarchicalAStar,
+        pygame.K_l: incrementalAStar,
+    }
+
+    # Mapping the keys that generates a maze, erasing everything on the window
+    maze_mapping = {
+        pygame.K_m: primsAlgorithm,
+        pygame.K_n: recursiveBacktracker,
+        pygame.K_o: randomFill,
     }
 
     start_node = None
     end_node = None
+    previous_xy = None # The mouse position of the previous event while a button is held
 
     while True:
         for event in pygame.event.get():
@@ -25,23 +49,60 @@ def main():
                 
             if pygame.mouse.get_pressed()[0]: # LEFT MOUSE BUTTON
                 mouse_xy = pygame.mouse.get_pos()
-                start_node, end_node = gui.setNodeColor(mouse_xy, start_node, end_node)
+                start_node, end_node = gui.setNodeColor(mouse_xy, start_node, end_node, previous_xy)
 
 
             if pygame.mouse.get_pressed()[2]: # RIGHT MOUSE BUTTON
                 mouse_xy = pygame.mouse.get_pos()
-                start_node, end_node = gui.resetNodeColor(mouse_xy, start_node, end_node)
+                start_node, end_node = gui.resetNodeColor(mouse_xy, start_node, end_node, previous_xy)
+
+            # Remembering the position while dragging, so the nodes between two events are painted too
+            previous_xy = pygame.mouse.get_pos() if any(pygame.mouse.get_pressed()) else None
             
             if event.type == pygame.KEYDOWN:
                 # Look for the keys that triggers an algorithm initialization
                 if event.key in search_mapping.keys():
                     if start_node and end_node:
-                        gui.updateNodeNeighbors()
                         gui.reset(exeptions=["wall", "start point", "end point"])
                         search = search_mapping[event.key]
-                        gui.fps = path_finding_fps
-                        search(gui, start_node, end_node)
-                        gui.fps = gui_fps
+                        try:
+                            search(gui, start_node, end_node)
+                        except AttributeError as error: # The algorithm does not support the topology, corner rule or costs
+                            print(error)
+
+                # Look for the keys that selects the terrain cost painted, 1 paints walls
+                if pygame.K_1 <= event.key <= pygame.K_9:
+                    gui.brush_cost = event.key - pygame.K_0
+
+                # Look for the key that switches between 4 and 8 directions of movement
+                if event.key == pygame.K_t:
+                    gui.setTopology("square8" if gui.model.topology == "square4" else "square4")
+
+                # Look for the key that sends many agents between random points at once
+                if event.key == pygame.K_g:
+                    start_node, end_node = None, None
+                    gui.reset(exeptions=["wall"])
+                    empty = [node for node in gui.grid if node.state == "empty"]
+                    picks = random.sample(empty, min(len(empty) // 2, agent_count) * 2)
+                    cooperativeAStar(gui, list(zip(picks[::2], picks[1::2])))
+
+                # Look for the keys that generates a maze
+                if event.key in maze_mapping.keys():
+                    start_node, end_node = None, None
+                    gui.model.clearCosts()
+                    maze_mapping[event.key](gui.model)
+                    gui.redraw()
+
+                # Look for the key that shows or hides the counters of the last search
+                if event.key == pygame.K_i:
+                    gui.toggleHud()
+
+                # Look for the keys that writes the walls and costs to a map file, or reads them back
+                if event.key == pygame.K_w:
+                    gui.saveMap(map_path)
+                if event.key == pygame.K_r and os.path.exists(map_path):
+                    start_node, end_node = None, None
+                    gui.loadMap(map_path)
 
                 # Look for the keys that resets all blocks
                 if event.key == pygame.K_SPACE:
@@ -0,0 +1,261 @@
+import mmap
+import os
+import struct
+from grid import Grid, EMPTY, WALL, MAX_COST, TOPOLOGIES
+from topology import CORNER_RULES
+
+
+# Header of the binary maps: magic, version, topology, corner rule, flags, rows and columns.
+# It is followed by the wall plane, one bit per cell (most significant bit first) padded
+# to a whole byte, and by the cost plane, one byte per cell, when the flags have HAS_COSTS
+MAP_MAGIC = b"GRID"
+MAP_VERSION = 1
+MAP_HEADER = struct.Struct("<4sBBBBII")
+HAS_COSTS = 1
+
+# The passable terrain of the MovingAI maps, any other character being impassable
+MOVINGAI_OPEN = b".GS"
+
+
+def loadCostMap(path:str, topology:str = "square4") -> Grid:
+    """Loads a grid from a text file of terrain costs
+
+    Every line is a row of costs separated by spaces or commas: 0 for a wall, else the
+    cost of entering the cell, from 1 to "grid.MAX_COST". Empty lines and lines starting
+    with "#" are skipped.
+
+    Parameters
+    ----------
+    path : str
+        The file path
+    topology : str, optional
+        The topology of the grid, by default "square4"
+
+    Returns
+    -------
+    Grid
+        The grid, with a cost layer if any cell costs more than 1
+    """
+    with open(path) as file:
+        lines = [line.replace(",", " ").split() for line in file]
+    rows = [[int(value) for value in line] for line in lines if line and not line[0].startswith("#")]
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        raise AttributeError(f'The cost map "{path}" must have rows of the same length')
+
+    values = [value for row in rows for value in row]
+    if not all(0 <= value <= MAX_COST for value in values):
+        raise AttributeError(f'The costs of "{path}" must be in the range [0, {MAX_COST}]')
+
+    grid = Grid(len(rows), len(rows[0]), topology)
+    grid.cells[:] = bytes(WALL if value == 0 else 0 for value in values)
+    if any(value > 1 for value in values):
+        grid.costs = bytearray(max(value, 1) for value in values)
+    grid.notifyWalls()
+    return grid
+
+
+def saveCostMap(grid:Grid, path:str) -> None:
+    """Saves the walls and terrain costs of a grid to a text file readable by "loadCostMap"
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid
+    path : str
+        The file path
+    """
+    with open(path, "w") as file:
+        for row in range(grid.rows):
+            values = [
+                0 if grid.isWall(idx) else grid.getCost(idx)
+                for idx in range(grid.index(row, 0), grid.index(row, grid.cols))
+            ]
+            file.write(" ".join(map(str, values)) + "\n")
+
+
+def saveBinaryMap(grid:Grid, path:str) -> None:
+    """Saves the walls and terrain costs of a grid to a binary file readable by "loadBinaryMap"
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid
+    path : str
+        The file path
+    """
+    import numpy as np
+
+    size = len(grid)
+    cells = np.frombuffer(grid.cells, dtype=np.uint8, count=size)
+    flags = 0 if grid.costs is None else HAS_COSTS
+    with open(path, "wb") as file:
+        file.write(MAP_HEADER.pack(
+            MAP_MAGIC, MAP_VERSION, TOPOLOGIES.index(grid.topology), CORNER_RULES.index(grid.corner_rule),
+            flags, grid.rows, grid.cols
+        ))
+        file.write(np.packbits(cells == WALL).tobytes())
+        if grid.costs is not None:
+            file.write(grid.costs[:size])
+
+
+def loadBinaryMap(path:str) -> Grid:
+    """Loads a grid from a binary file written by "saveBinaryMap"
+
+    The file is memory-mapped copy-on-write: the cost plane is used by the grid without
+    copying it, editing the costs never changing the file, and the wall plane is
+    unpacked into the cell states at once, so multi-million-cell maps load in milliseconds.
+
+    Parameters
+    ----------
+    path : str
+        The file path
+
+    Returns
+    -------
+    Grid
+        The grid, with its saved topology, corner rule and cost layer
+    """
+    import numpy as np
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < MAP_HEADER.size:
+            raise AttributeError(f'The file "{path}" is not a binary map')
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    magic, version, topology, corner_rule, flags, rows, cols = MAP_HEADER.unpack_from(data)
+    if magic != MAP_MAGIC:
+        raise AttributeError(f'The file "{path}" is not a binary map')
+    if version != MAP_VERSION:
+        raise AttributeError(f'The binary map "{path}" has version {version}, expected {MAP_VERSION}')
+    if topology >= len(TOPOLOGIES) or corner_rule >= len(CORNER_RULES):
+        raise AttributeError(f'The binary map "{path}" has an unknown topology or corner rule')
+
+    size = rows * cols
+    walls_end = MAP_HEADER.size + ((size + 7) // 8)
+    costs_end = walls_end + (size if flags & HAS_COSTS else 0)
+    if len(data) < costs_end:
+        raise AttributeError(f'The binary map "{path}" is truncated')
+
+    walls = np.frombuffer(data, dtype=np.uint8, count=walls_end - MAP_HEADER.size, offset=MAP_HEADER.size)
+    cells = bytearray(size)
+    np.frombuffer(cells, dtype=np.uint8)[:] = np.unpackbits(walls, count=size) * np.uint8(WALL)
+    costs = memoryview(data)[walls_end:costs_end] if flags & HAS_COSTS else None
+    return Grid(rows, cols, TOPOLOGIES[topology], cells, costs, CORNER_RULES[corner_rule])
+
+
+def loadMovingAIMap(path:str, topology:str = "square8", corner_rule:str = "no-cut") -> Grid:
+    """Loads a grid from a map of the MovingAI benchmark sets
+
+    The file has a header ("type", "height", "width" and "map" lines) followed by a row of
+    characters per line: ".", "G" and "S" are passable, any other one (e.g. "@", "O", "T"
+    or "W") is a wall. The default topology and corner rule match the ones the optimal
+    lengths of the benchmark scenarios were computed with.
+
+    Reference: [https://movingai.com/benchmarks/formats.html]
+
+    Parameters
+    ----------
+    path : str
+        The file path
+    topology : str, optional
+        The topology of the grid, by default "square8"
+    corner_rule : str, optional
+        The rule for diagonal moves beside walls, by default "no-cut"
+
+    Returns
+    -------
+    Grid
+        The grid
+    """
+    with open(path, "rb") as file:
+        header = {}
+        for line in file:
+            fields = line.split()
+            if fields and fields[0].lower() == b"map":
+                break
+            if len(fields) == 2:
+                header[fields[0].lower()] = fields[1]
+        lines = file.read().split()
+
+    try:
+        rows, cols = int(header[b"height"]), int(header[b"width"])
+    except (KeyError, ValueError):
+        raise AttributeError(f'The map "{path}" must have a "height" and a "width" in its header')
+    if len(lines) != rows or any(len(line) != cols for line in lines):
+        raise AttributeError(f'The map "{path}" must have {rows} rows of {cols} characters')
+
+    table = bytes(EMPTY if byte in MOVINGAI_OPEN else WALL for byte in range(256))
+    return Grid(rows, cols, topology, bytearray(b"".join(lines).translate(table)), corner_rule=corner_rule)
+
+
+def saveMovingAIMap(grid:Grid, path:str) -> None:
+    """Saves the walls of a grid to a MovingAI map readable by "loadMovingAIMap"
+
+    The format has no terrain costs, every open cell is written as "." and every wall as "@".
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid
+    path : str
+        The file path
+    """
+    table = bytes(ord("@") if code == WALL else ord(".") for code in range(256))
+    cells = bytes(grid.cells[:len(grid)]).translate(table)
+    with open(path, "wb") as file:
+        file.write(f"type octile\nheight {grid.rows}\nwidth {grid.cols}\nmap\n".encode())
+        for row in range(grid.rows):
+            file.write(cells[row * grid.cols:(row + 1) * grid.cols] + b"\n")
+
+
+def loadScenarios(path:str) -> list:
+    """Loads the problems of a MovingAI scenario file
+
+    Every line after the version one holds a bucket, a map name, the map width and height,
+    the starting and ending columns and rows and the optimal length of the path.
+
+    Parameters
+    ----------
+    path : str
+        The file path
+
+    Returns
+    -------
+    list
+        The (map name, starting cell, ending cell, optimal length) of every problem
+    """
+    problems = []
+    with open(path) as file:
+        for line in file:
+            fields = line.split()
+            if len(fields) < 9 or fields[0].lower() == "version":
+                continue
+            # The map name may contain spaces, so the other fields are read from both ends
+            width = int(fields[-7])
+            start_col, start_row, end_col, end_row = map(int, fields[-5:-1])
+            problems.append((
+                " ".join(fields[1:-7]), (start_row * width) + start_col, (end_row * width) + end_col, float(fields[-1])
+            ))
+    return problems
+
+
+def loadMap(path:str) -> Grid:
+    """Loads a grid from any supported file, by its extension: ".map" for MovingAI maps,
+    ".grid" for binary maps and any other one for text cost maps
+
+    Parameters
+    ----------
+    path : str
+        The file path
+
+    Returns
+    -------
+    Grid
+        The grid
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".map":
+        return loadMovingAIMap(path)
+    if extension == ".grid":
+        return loadBinaryMap(path)
+    return loadCostMap(path)
@@ -1,24 +1,256 @@
+import random
+from grid import Grid, EMPTY, WALL
 
 
-def primsAlgorithm(self, grid:list, start, end)->None:
-    """A maze generator through the Prim's Algorithm method. 
+# Every generator writes straight into "grid.cells" and then calls "grid.notifyWalls()",
+# so nodes viewing the grid must be redrawn afterwards (see "Gui.redraw").
+
+
+def randomFill(grid:Grid, density:float = 0.3, seed:int = None) -> None:
+    """Turns every cell into a wall with a given probability, erasing anything else
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be filled
+    density : float, optional
+        The probability of a cell being a wall, by default 0.3
+    seed : int, optional
+        The seed of the random generator, the same seed always gives the same walls, by default None
+    """
+    rnd = random.Random(seed)
+    # Mapping each random byte to a wall or an empty cell according to the density
+    threshold = round(density * 256)
+    table = bytes(WALL if byte < threshold else EMPTY for byte in range(256))
+    grid.cells[:len(grid)] = rnd.randbytes(len(grid)).translate(table)
+    grid.notifyWalls()
+
+
+def mazeCells(grid:Grid) -> tuple:
+    """Gets the layout of a maze carved in the grid
+
+    The maze rooms are the cells in odd rows and odd columns, the cells between two
+    rooms are the passages and every other cell stays a wall.
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid
+
+    Returns
+    -------
+    tuple
+        The amount of rows and columns of rooms
+    """
+    return (grid.rows - 1) // 2, (grid.cols - 1) // 2
+
+
+def primsAlgorithm(grid:Grid, seed:int = None) -> None:
+    """A maze generator through the randomized Prim's Algorithm method.
     Algorithm:
-    
+
     Start with a grid full of walls
-    Pick a cell, mark it as part of the maze. Add the walls of the cell to the walls of the list
-    While there are walls in the list:
-        Pick a random wall from the list. If only one of the two cells that the wall divides is visited, then:
-            Make the wall a passage and mark the unvisited cell as part of the maze
-            Add the neighboring walls of the cell to the wall list.
-        Remove the wall from the list
+    Pick a cell, mark it as part of the maze. Add its neighboring cells to the frontier
+    While there are cells in the frontier:
+        Pick a random cell from the frontier and connect it to a random neighbor already in the maze
+        Add its neighboring cells that are not in the maze yet to the frontier
 
     References: [https://medium.com/swlh/fun-with-python-1-maze-generator-931639b4fb7e]
 
     Parameters
     ----------
-    grid : list
-        A square grid with the nodes. 
+    grid : Grid
+        The grid to be carved, anything in it is erased
+    seed : int, optional
+        The seed of the random generator, the same seed always gives the same maze, by default None
+    """
+    rnd = random.Random(seed)
+    cells, cols = grid.cells, grid.cols
+    cells[:len(grid)] = bytes([WALL]) * len(grid)
+    m_rows, m_cols = mazeCells(grid)
+    if not (m_rows and m_cols):
+        grid.notifyWalls()
+        return
+
+    last_row, last_col = (2 * m_rows) - 1, (2 * m_cols) - 1
+    # The rooms two cells away of every room, each with the passage between them
+    steps = ((-2, -1), (2, 1), (-2*cols, -cols), (2*cols, cols))
+    in_frontier = bytearray(len(grid))
+
+    first = grid.index((2 * rnd.randrange(m_rows)) + 1, (2 * rnd.randrange(m_cols)) + 1)
+    frontier = [first]
+    in_frontier[first] = 1
+
+    randrange = rnd.randrange
+    while frontier:
+        # Removing a random frontier cell in O(1) by swapping it with the last one
+        pick = randrange(len(frontier))
+        current = frontier[pick]
+        frontier[pick] = frontier[-1]
+        frontier.pop()
+
+        row, col = divmod(current, cols)
+        inside = (1 < col, col < last_col, 1 < row, row < last_row)
+        carved = []
+        for (room_step, passage_step), condition in zip(steps, inside):
+            if not condition:
+                continue
+            room = current + room_step
+            if cells[room] == EMPTY:
+                carved.append(current + passage_step)
+            elif not in_frontier[room]:
+                in_frontier[room] = 1
+                frontier.append(room)
+        cells[current] = EMPTY
+        if carved:
+            cells[carved[randrange(len(carved))]] = EMPTY
+
+    grid.notifyWalls()
+
+
+def recursiveBacktracker(grid:Grid, seed:int = None) -> None:
+    """A maze generator through the recursive backtracker (randomized depth-first search) method.
+    Algorithm:
+
+    Start with a grid full of walls
+    Pick a cell, mark it as part of the maze and push it to the stack
+    While the stack is not empty:
+        If the cell on top of the stack has neighbors out of the maze:
+            Carve the passage to a random one of them, mark it and push it to the stack
+        Else pop it from the stack
+
+    It is implemented with an explicit stack, making long and winding corridors.
+
+    Reference: [https://en.wikipedia.org/wiki/Maze_generation_algorithm#Randomized_depth-first_search]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be carved, anything in it is erased
+    seed : int, optional
+        The seed of the random generator, the same seed always gives the same maze, by default None
+    """
+    rnd = random.Random(seed)
+    cells, cols = grid.cells, grid.cols
+    cells[:len(grid)] = bytes([WALL]) * len(grid)
+    m_rows, m_cols = mazeCells(grid)
+    if not (m_rows and m_cols):
+        grid.notifyWalls()
+        return
+
+    last_row, last_col = (2 * m_rows) - 1, (2 * m_cols) - 1
+    first = grid.index((2 * rnd.randrange(m_rows)) + 1, (2 * rnd.randrange(m_cols)) + 1)
+    cells[first] = EMPTY
+    stack = [first]
+
+    randrange = rnd.randrange
+    while stack:
+        current = stack[-1]
+        row, col = divmod(current, cols)
+        cond_idx = [
+            (1 < col, current-2, current-1), (col < last_col, current+2, current+1),
+            (1 < row, current-2*cols, current-cols), (row < last_row, current+2*cols, current+cols)
+        ]
+        options = [(room, passage) for condition, room, passage in cond_idx if condition and cells[room] == WALL]
+        if not options:
+            stack.pop()
+            continue
+        room, passage = options[randrange(len(options))]
+        cells[passage] = EMPTY
+        cells[room] = EMPTY
+        stack.append(room)
+
+    grid.notifyWalls()
+
+
+
+def spanningTreeMaze(grid:Grid, seed:int = None) -> None:
+    """A maze generator through a random spanning tree of the rooms, vectorized with NumPy.
+    Algorithm (Boruvka's):
+
+    Start with a grid full of walls, every room being its own component, and give every
+    passage a distinct random weight
+    While there are passages between different components:
+        Every component carves its lightest passage to another component
+        Merge the components joined by the carved passages
+
+    With random weights the maze is the same kind Kruskal's Algorithm makes. Every round
+    at least halves the amount of components and runs on whole arrays at once, making it
+    the fastest generator for large grids.
+
+    Reference: [https://en.wikipedia.org/wiki/Bor%C5%AFvka%27s_algorithm]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be carved, anything in it is erased
+    seed : int, optional
+        The seed of the random generator, the same seed always gives the same maze, by default None
     """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    view = np.frombuffer(grid.cells, dtype=np.uint8, count=len(grid)).reshape(grid.rows, grid.cols)
+    view[:] = WALL
+    m_rows, m_cols = mazeCells(grid)
+    rooms = m_rows * m_cols
+    if not rooms:
+        grid.notifyWalls()
+        return
+
+    # Every passage joins a room to its right or bottom neighbor, the position in the shuffled
+    # arrays being its weight
+    ids = np.arange(rooms, dtype=np.int32).reshape(m_rows, m_cols)
+    first = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    second = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    order = rng.permutation(first.size)
+    first, second = first[order], second[order]
+    below = order >= m_rows * (m_cols - 1)
+
+    carved = np.zeros(first.size, dtype=bool)
+    passages = np.arange(first.size, dtype=np.int32)
+    label = np.arange(rooms, dtype=np.int32) # The component of each room
+    first_label, second_label = first, second
+    lightest = np.empty(rooms, dtype=np.int32)
+    while passages.size:
+        lightest.fill(first.size)
+        np.minimum.at(lightest, first_label, passages)
+        np.minimum.at(lightest, second_label, passages)
+        components = np.flatnonzero(lightest < first.size).astype(np.int32)
+        chosen = lightest[components]
+        carved[chosen] = True
+
+        # Pointing every component to the one across its passage, two components choosing the
+        # same passage point to the smallest of them, then following the pointers to the roots
+        a, b = label[first[chosen]], label[second[chosen]]
+        other = np.where(a == components, b, a)
+        parent = np.arange(rooms, dtype=np.int32)
+        parent[components] = other
+        mutual = (parent[other] == components) & (components < other)
+        parent[components[mutual]] = components[mutual]
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+        # Dropping the passages inside a component
+        first_label, second_label = parent[first_label], parent[second_label]
+        between = first_label != second_label
+        passages, first_label, second_label = passages[between], first_label[between], second_label[between]
+        label = parent[label]
+
+    view[1:2*m_rows:2, 1:2*m_cols:2] = EMPTY
+    row, col = np.divmod(first[carved], m_cols)
+    # The passage is next to the room, on the right of it or below it
+    below = below[carved]
+    view[(2 * row) + 1 + below, (2 * col) + 1 + (~below)] = EMPTY
+    grid.notifyWalls()
 
-    pass
-    
+# Mapping the names of the generators, useful for command line options
+generators = {
+    "random": randomFill,
+    "prims": primsAlgorithm,
+    "backtracker": recursiveBacktracker,
+    "spanning": spanningTreeMaze,
+}
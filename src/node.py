@@ -1,15 +1,35 @@
 import math
 import pygame
 import colors
+from grid import Grid, STATES, STATE_CODES
 
 class Node(object):
     size = 0
     max_neighbors = 0
-    def __init__(self, row:int, col:int, part:int, pad_x:int, pad_y:int, window: pygame.Surface) -> None:
+    state_color_map = {
+        "empty": colors.WHITE,
+        "wall": colors.BLACK,
+        "start point": colors.GREEN,
+        "end point": colors.RED,
+        "path": colors.TURQUOISE,
+        "visited": colors.ORANGE,
+        "watch": colors.PURPLE
+    }
+    terrain_color = colors.BROWN # The color of the most costly empty nodes, see "getTerrainColor"
+    terrain_shades = 7 # Amount of colors between plain and most costly empty nodes, at most 7 (see "Gui.blitGrid")
+    topology = None
+    dirty_rects = [] # Areas of the window drawn since the last display update, see "Gui.updateContents"
+    __slots__ = ("grid", "index", "row", "col", "x0", "y0", "window", "form")
+
+    def __init__(self, grid:Grid, row:int, col:int, part:int, pad_x:int, pad_y:int, window: pygame.Surface) -> None:
         """A class that represents a unique node in the grid of the Window
 
+        The node is a view over a cell of the grid model, its state lives in the grid buffer.
+
         Parameters
         ----------
+        grid : Grid
+            The grid model holding the state of the node
         row : int
             The row index of the node
         col : int
@@ -24,22 +44,19 @@ class Node(object):
             The window where the node will be drawn
         """
         
+        self.grid = grid
+        self.index = grid.index(row, col)
         self.row = row
         self.col = col
         self.x0 = (col * part) + pad_x
         self.y0 = (row * part) + pad_y
         self.window = window
-        self.neighbors = []
-        self.state_color_map = {
-            "empty": colors.WHITE,
-            "wall": colors.BLACK,
-            "start point": colors.GREEN,
-            "end point": colors.RED,
-            "path": colors.TURQUOISE,
-            "visited": colors.ORANGE,
-            "watch": colors.PURPLE
-        }
-    
+
+    @property
+    def state(self) -> str:
+        """The current state of the node
+        """
+        return STATES[self.grid.cells[self.index]]
 
     def setState(self, state:str) -> None:
         """Sets the state of the node
@@ -55,22 +72,74 @@ class Node(object):
                 f'States currently defined: {self.state_color_map.keys()}'
             )
 
-        self.state = state
-        self.draw()
+        self.grid.setCode(self.index, STATE_CODES[state])
+        self.dirty_rects.append(self.draw())
+
+    def setCost(self, cost:int) -> None:
+        """Sets the cost of entering the node (see "Grid.setCost")
+
+        Parameters
+        ----------
+        cost : int
+            The cost, from 1 to "grid.MAX_COST"
+        """
+        self.grid.setCost(self.index, cost)
+        self.dirty_rects.append(self.draw())
 
     def getColor(self) -> tuple:
-        """Gets the color based on the current state of the node
+        """Gets the color based on the current state of the node, shaded by its cost when empty
 
         Returns
         -------
         tuple
             The RGB color
         """
-        return self.state_color_map[self.state]
+        state = self.state
+        if state == "empty":
+            return self.getTerrainColor(self.terrainShade(self.grid.getCost(self.index)))
+        return self.state_color_map[state]
+
+    @classmethod
+    def terrainShade(cls, cost:int) -> int:
+        """Gets the shade of an empty node of a given cost
+
+        Parameters
+        ----------
+        cost : int
+            The cost of entering the node
 
+        Returns
+        -------
+        int
+            0 for plain nodes, up to "terrain_shades" for the most costly ones
+        """
+        return min(cls.terrain_shades, cost - 1)
+
+    @classmethod
+    def getTerrainColor(cls, shade:int) -> tuple:
+        """Gets the color of an empty node of a given shade, from the empty color to "terrain_color"
+
+        Parameters
+        ----------
+        shade : int
+            The shade, see "terrainShade"
+
+        Returns
+        -------
+        tuple
+            The RGB color
+        """
+        empty = cls.state_color_map["empty"]
+        return tuple(round(e + (t - e) * shade / cls.terrain_shades) for e, t in zip(empty, cls.terrain_color))
 
-    def draw(self) -> None:
+
+    def draw(self) -> pygame.Rect:
         """Draws the node on the window
+
+        Returns
+        -------
+        pygame.Rect
+            The area of the window drawn
         """
         raise NotImplementedError
 
@@ -79,67 +148,78 @@ class Node(object):
         """
         raise NotImplementedError
 
-    def updateNeighbors() -> None:
-        """Seeks for the adjacent nodes
+    @classmethod
+    def locate(cls, x:float, y:float, part:int, pad_x:int, pad_y:int) -> tuple:
+        """Finds the node under a pixel coordinate in O(1), without looking at any node
+
+        Parameters
+        ----------
+        x : float
+            The horizontal pixel value
+        y : float
+            The vertical pixel value
+        part : int
+            The space occupied by a node and a gap
+        pad_x : int
+            The initial horizontal pixel position of the nodes
+        pad_y : int
+            The initial vertical pixel position of the nodes
+
+        Returns
+        -------
+        tuple
+            The row and column of the node, which may be out of the grid
         """
         raise NotImplementedError
 
+    @property
+    def neighbors(self) -> list:
+        """The indices of the adjacent open cells, computed from the grid topology
+        """
+        return self.grid.neighbors(self.index)
+
 
     
     def __eq__(self, other: object) -> bool:
         if not other:
             return False
-        return (self.row == other.row) and (self.col == other.col)
+        return self.index == other.index
 
     def __repr__(self) -> str:
         return f'Node({self.row}, {self.col})'
     
     def __hash__(self) -> int:
-        # Ajusting the class to be hashable based on its representation (__repr__)
-        # This allows for example using nodes instances as keys in dictionaries.
-        return hash(str(self))
+        # Hashing by the cell index allows using nodes instances as keys in dictionaries.
+        return self.index
 
     __str__ = __repr__
 
 
 
 class Square(Node):
-    def __init__(self, row:int, col:int, part:int, pad_x:int, pad_y:int, window: pygame.Surface) -> None:
-        super().__init__(row, col, part, pad_x, pad_y, window)
+    max_neighbors = 4
+    topology = "square4"
+    __slots__ = ()
+
+    def __init__(self, grid:Grid, row:int, col:int, part:int, pad_x:int, pad_y:int, window: pygame.Surface) -> None:
+        super().__init__(grid, row, col, part, pad_x, pad_y, window)
         self.form =  pygame.Rect(self.x0, self.y0, self.size, self.size)
-        self.setState("empty")
-        self.max_neighbors = 4
+        self.draw()
         
 
-    def draw(self) -> None:
+    def draw(self) -> pygame.Rect:
         """Draws the node on the window
+
+        Returns
+        -------
+        pygame.Rect
+            The area of the window drawn
         """
 
         color = self.getColor()
-        pygame.draw.rect(self.window, color, self.form)
+        return pygame.draw.rect(self.window, color, self.form)
             
 
-    def updateNeighbors(self, grid:list, h_nodes:int, v_nodes:int) -> None:
-        """Seeks for the adjacent nodes
-
-        Parameters
-        ----------
-        grid : list
-            The list containing all nodes of the grid
-        h_nodes : int
-            Amount of horizontal nodes
-        v_nodes : int
-            Amount of vertical nodes
-        """
-
-        idx = (self.row * h_nodes) + self.col
-        cond_idx = [
-            (0 < self.col, idx-1),       (self.col < h_nodes-1, idx+1), # HORIZONTAL ADJACENT NODES
-            (0 < self.row, idx-h_nodes), (self.row < v_nodes-1, idx+h_nodes) # VERTICAL ADJACENT NODES
-        ]
-        self.neighbors = [grid[i] for condition, i in cond_idx if condition and grid[i].state!="wall"]
-        
-
     def isCoordinateIn(self, x:int, y:int) -> bool:
         """Indicates whether a given pixel coordinate is part of the node
 
@@ -159,14 +239,43 @@ class Square(Node):
         # return (self.x0 <= x <= x_end) and (self.y0 <= y <= y_end)
         return self.form.collidepoint((x, y))
 
+    @classmethod
+    def locate(cls, x:float, y:float, part:int, pad_x:int, pad_y:int) -> tuple:
+        """Finds the node under a pixel coordinate in O(1), without looking at any node
+
+        A gap belongs to the node on its left or above it.
+
+        Parameters
+        ----------
+        x : float
+            The horizontal pixel value
+        y : float
+            The vertical pixel value
+        part : int
+            The space occupied by a node and a gap
+        pad_x : int
+            The initial horizontal pixel position of the nodes
+        pad_y : int
+            The initial vertical pixel position of the nodes
+
+        Returns
+        -------
+        tuple
+            The row and column of the node, which may be out of the grid
+        """
+        return int((y - pad_y) // part), int((x - pad_x) // part)
+
 
 
 
 
 class Hexagon(Node):
-    def __init__(self, row:int, col:int, part:int, pad_x:int, pad_y:int, window: pygame.Surface) -> None:
-        super().__init__(row, col, part, pad_x, pad_y, window)
-        self.max_neighbors = 6
+    max_neighbors = 6
+    topology = "hex"
+    __slots__ = ()
+
+    def __init__(self, grid:Grid, row:int, col:int, part:int, pad_x:int, pad_y:int, window: pygame.Surface) -> None:
+        super().__init__(grid, row, col, part, pad_x, pad_y, window)
         
         self.y0 += self.size/2 if col % 2 != 0 else 0
 
@@ -180,36 +289,78 @@ class Hexagon(Node):
             )
             for i in range(6)
         ]
-        self.setState("empty")
+        self.draw()
         
 
-    def draw(self) -> None:
+    def draw(self) -> pygame.Rect:
         """Draws the node on the window
+
+        Returns
+        -------
+        pygame.Rect
+            The area of the window drawn
         """
 
         color = self.getColor()
-        pygame.draw.polygon(self.window, color, self.form)
-            
+        return pygame.draw.polygon(self.window, color, self.form)
+
+    def isCoordinateIn(self, x:int, y:int) -> bool:
+        """Indicates whether a given pixel coordinate is part of the node
+
+        Parameters
+        ----------
+        x : int
+            The horizontal pixel value
+        y : int
+            The vertical pixel value
+
+        Returns
+        -------
+        bool
+            True, if received coordinate it's part of the node
+        """
+        # The hexagon has flat top and bottom sides, checking them and the slanted sides
+        # of the quadrant holding the coordinate
+        r = self.size / 2
+        dx, dy = abs(x - (self.x0 + r)), abs(y - (self.y0 + r))
+        half_height = r * math.sqrt(3) / 2
+        return dy <= half_height and (math.sqrt(3) * dx) + dy <= math.sqrt(3) * r
 
-    def updateNeighbors(self, grid:list, h_nodes:int, v_nodes:int) -> None:
-        """Seeks for the adjacent nodes
+    @classmethod
+    def locate(cls, x:float, y:float, part:int, pad_x:int, pad_y:int) -> tuple:
+        """Finds the node under a pixel coordinate in O(1), without looking at any node
+
+        The node is the one with the nearest center: the offset coordinate is rounded to
+        a candidate, then its neighbors from the columns around are compared.
 
         Parameters
         ----------
-        grid : list
-            The list containing all nodes of the grid
-        h_nodes : int
-            Amount of horizontal nodes
-        v_nodes : int
-            Amount of vertical nodes
-        """
-
-        idx = (self.row * h_nodes) + self.col
-        cond_idx = [
-            (0 < self.col, idx-1),       (self.col < h_nodes-1, idx+1), # HORIZONTAL ADJACENT NODES = UPPER DIOGONAL NODES
-            (0 < self.row, idx-h_nodes), (self.row < v_nodes-1, idx+h_nodes), # VERTICAL ADJACENT NODES = UPPER NODE
-            (self.row < v_nodes-1, idx-h_nodes-1), (self.row < v_nodes-1, idx+h_nodes+1) # BOTTOM -1/+1 ADJACENT NODES = LOWER DIOGONAL NODES
-        ]
-        self.neighbors = [grid[i] for condition, i in cond_idx if condition and grid[i].state!="wall"]
+        x : float
+            The horizontal pixel value
+        y : float
+            The vertical pixel value
+        part : int
+            The space occupied by a node and a gap
+        pad_x : int
+            The initial horizontal pixel position of the nodes
+        pad_y : int
+            The initial vertical pixel position of the nodes
 
-    # TODO: Implement "isCoordinateIn" method
\ No newline at end of file
+        Returns
+        -------
+        tuple
+            The row and column of the node, which may be out of the grid
+        """
+        r = cls.size / 2
+        col = round((x - pad_x - r) / part)
+        candidates = []
+        for c in (col - 1, col, col + 1):
+            # Odd columns are shifted half a node down
+            shift = r if c % 2 != 0 else 0
+            row = round((y - pad_y - r - shift) / part)
+            for candidate_row in (row - 1, row, row + 1):
+                center_x = (c * part) + pad_x + r
+                center_y = (candidate_row * part) + pad_y + shift + r
+                candidates.append(((center_x - x) ** 2 + (center_y - y) ** 2, candidate_row, c))
+        _, row, col = min(candidates)
+        return row, col
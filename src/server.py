@@ -0,0 +1,361 @@
+import argparse
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from grid import Grid, TOPOLOGIES
+from maze_generator import generators
+from maps import loadMap
+from benchmark import algorithms, buildMap
+from solvers import SearchResult, PathCache, ComponentIndex, pathCost
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search once nobody waits for its result anymore"""
+
+
+class InFlight(object):
+    def __init__(self, future:asyncio.Future, cancelled:threading.Event) -> None:
+        """A search running in the executor, shared by every request asking for the same query
+
+        Parameters
+        ----------
+        future : asyncio.Future
+            The future of the search result
+        cancelled : threading.Event
+            Stops the search at its next step once set
+        """
+        self.future = future
+        self.cancelled = cancelled
+        self.waiters = 0
+
+
+class SolverService(object):
+    def __init__(self, grid:Grid, workers:int = None, timeout:float = 10.0) -> None:
+        """Answers path queries on a grid from an asyncio event loop
+
+        The searches run in a thread pool, so the event loop keeps serving the other
+        requests while they run. A query asked again while its search is running waits
+        for the same search, and a query already answered is served by a "PathCache".
+        The searches are stopped mid-way, through their observer, once every request
+        waiting for them timed out or was cancelled.
+
+        The grid is only read, so the threads can share it: the walls must not change
+        while the service runs.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid the queries are answered on
+        workers : int, optional
+            The amount of searches running at once, by default the executor default
+        timeout : float, optional
+            The seconds a request waits for its path when it sets no timeout, by default 10.0
+        """
+        self.grid = grid
+        self.executor = ThreadPoolExecutor(workers)
+        self.timeout = timeout
+        self.in_flight = {} # The running searches, by query
+        self.path_cache = PathCache(grid)
+        self.coalesced = 0 # The requests that waited for a search already running
+        # Labeling the regions up front, so the searches only read them to reject the unreachable queries
+        self.components = ComponentIndex(grid)
+        self.components.relabel()
+
+    def close(self) -> None:
+        """Stops the running searches and shuts the executor down
+        """
+        for query in self.in_flight.values():
+            query.cancelled.set()
+        self.executor.shutdown(wait=True)
+        self.components.close()
+
+    def runSearch(self, search, start:int, end:int, cancelled:threading.Event) -> SearchResult:
+        """Runs a solver in a worker thread, raising "SearchCancelled" at its first step after a cancellation
+
+        Parameters
+        ----------
+        search : callable
+            The solver, e.g. "solvers.aStar"
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        cancelled : threading.Event
+            Set to stop the search
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics
+        """
+        def observer(cell:int, state:str) -> None:
+            if cancelled.is_set():
+                raise SearchCancelled()
+
+        observer(start, "watch") # The search may have been cancelled while it was queued
+        return search(self.grid, start, end, observer=observer)
+
+    async def solve(self, name:str, start:int, end:int, timeout:float = None) -> SearchResult:
+        """Answers a path query, sharing the search of an identical query already running
+
+        Parameters
+        ----------
+        name : str
+            A name of "benchmark.algorithms"
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        timeout : float, optional
+            The seconds to wait for the path, by default "timeout" of the service
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the path was not found in time
+        """
+        if name not in algorithms:
+            raise AttributeError(f'The algorithm "{name}" is not available, choose one of {list(algorithms.keys())}')
+        for cell in (start, end):
+            if not 0 <= cell < len(self.grid):
+                raise AttributeError(f'The cell index {cell} is outside the grid')
+        search = algorithms[name]
+        cached = self.path_cache.get(search, start, end)
+        if cached is not None:
+            return cached
+
+        key = (name, start, end)
+        query = self.in_flight.get(key)
+        if query is None or query.cancelled.is_set(): # A search being stopped can not be shared anymore
+            cancelled = threading.Event()
+            future = asyncio.get_running_loop().run_in_executor(self.executor, self.runSearch, search, start, end, cancelled)
+            query = self.in_flight[key] = InFlight(future, cancelled)
+            future.add_done_callback(lambda future: self.finish(key, search, query))
+        else:
+            self.coalesced += 1
+
+        query.waiters += 1
+        try:
+            # Shielding the shared search, so a waiter leaving does not cancel it for the others
+            return await asyncio.wait_for(asyncio.shield(query.future), self.timeout if timeout is None else timeout)
+        finally:
+            query.waiters -= 1
+            if not query.waiters and not query.future.done():
+                query.cancelled.set()
+
+    def finish(self, key:tuple, search, query:InFlight) -> None:
+        """Caches the result of a search that ended, in the event loop thread
+
+        Parameters
+        ----------
+        key : tuple
+            The query, as (name, start, end)
+        search : callable
+            The solver
+        query : InFlight
+            The search that ended
+        """
+        if self.in_flight.get(key) is query:
+            del self.in_flight[key]
+        if query.future.cancelled() or query.future.exception() is not None:
+            return # Also marks the exception of a stopped search as retrieved
+        self.path_cache.put(search, key[1], key[2], query.future.result())
+
+    async def answer(self, request:dict) -> dict:
+        """Answers a request decoded from the endpoint
+
+        Parameters
+        ----------
+        request : dict
+            The "algorithm" name (by default "aStar"), the "start" and "end" as [row, col],
+            an optional "timeout" in seconds and an optional "id" echoed back
+
+        Returns
+        -------
+        dict
+            The "id", and either whether the path was "found", the "path" as [row, col]
+            pairs, its "cost", the "expanded" nodes and the "elapsed" seconds, or an "error"
+        """
+        response = {"id": request.get("id")}
+        try:
+            start, end = self.cellAt(request["start"]), self.cellAt(request["end"])
+            result = await self.solve(request.get("algorithm", "aStar"), start, end, request.get("timeout"))
+        except asyncio.TimeoutError:
+            response["error"] = "timeout"
+        except (KeyError, TypeError, AttributeError) as error:
+            response["error"] = f'invalid request: {error}'
+        except Exception as error: # Any other failure still gets a response, so the client never waits forever
+            response["error"] = f'{type(error).__name__}: {error}'
+        else:
+            response.update({
+                "found": result.found,
+                "path": [list(self.grid.coords(cell)) for cell in result.path],
+                "cost": pathCost(self.grid, result.path),
+                "expanded": result.expanded,
+                "elapsed": result.elapsed,
+            })
+        return response
+
+    def cellAt(self, point:list) -> int:
+        """Gets the index of the cell at a point of a request
+
+        Parameters
+        ----------
+        point : list
+            The [row, col] of the cell, two integers
+
+        Returns
+        -------
+        int
+            The cell index
+        """
+        if not isinstance(point, list) or len(point) != 2 or not all(
+            isinstance(value, int) and not isinstance(value, bool) for value in point
+        ):
+            raise AttributeError(f'The cell {point!r} is not a [row, col] pair of integers')
+        row, col = point
+        if not (0 <= row < self.grid.rows and 0 <= col < self.grid.cols):
+            raise AttributeError(f'The cell {point} is outside the {self.grid.rows}x{self.grid.cols} grid')
+        return self.grid.index(row, col)
+
+    async def handle(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter) -> None:
+        """Serves a connection, one JSON request per line and one JSON response per line
+
+        The requests of a connection are answered concurrently, in the order their paths
+        are found. {"cancel": id} cancels a pending request, and closing the connection
+        cancels all of them.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The incoming stream
+        writer : asyncio.StreamWriter
+            The outgoing stream
+        """
+        pending = {} # The tasks answering the requests, by id
+        responding = set() # The tasks waiting for them to write their responses
+        lock = asyncio.Lock() # Writing one response at a time
+
+        async def send(response:dict) -> None:
+            async with lock:
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+
+        async def respond(id, answering:asyncio.Task) -> None:
+            try:
+                response = await answering
+            except asyncio.CancelledError:
+                if not answering.cancelled():
+                    raise # The connection is closing
+                response = {"id": id, "error": "cancelled"}
+            await send(response)
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("expected a JSON object")
+                except ValueError as error:
+                    await send({"id": None, "error": f'invalid request: {error}'})
+                    continue
+
+                if "cancel" in request:
+                    task = pending.get(request["cancel"])
+                    if task is not None:
+                        task.cancel()
+                    continue
+                id = request.get("id")
+                answering = pending[id] = asyncio.create_task(self.answer(request))
+                answering.add_done_callback(lambda task, id=id: pending.get(id) is task and pending.pop(id))
+                responder = asyncio.create_task(respond(id, answering))
+                responding.add(responder)
+                responder.add_done_callback(responding.discard)
+        except ConnectionError:
+            pass
+        finally:
+            for task in list(pending.values()) + list(responding):
+                task.cancel()
+            writer.close()
+
+    async def serve(self, host:str = "127.0.0.1", port:int = 8765) -> None:
+        """Listens for connections until cancelled
+
+        Parameters
+        ----------
+        host : str, optional
+            The interface listened on, by default "127.0.0.1" for local clients only
+        port : int, optional
+            The port, by default 8765
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+async def querySolver(requests:list, host:str = "127.0.0.1", port:int = 8765) -> list:
+    """Sends some requests to a running service over one connection and waits for their responses
+
+    Parameters
+    ----------
+    requests : list
+        The request dicts (see "SolverService.answer")
+    host : str, optional
+        The host of the service, by default "127.0.0.1"
+    port : int, optional
+        The port of the service, by default 8765
+
+    Returns
+    -------
+    list
+        The responses, in the order they arrived
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for request in requests:
+            writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        answered = sum("cancel" not in request for request in requests)
+        return [json.loads(await reader.readline()) for _ in range(answered)]
+    finally:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serves path queries on a map over a local socket, as JSON lines")
+    parser.add_argument("--host", default="127.0.0.1", help="The interface listened on")
+    parser.add_argument("--port", type=int, default=8765, help="The port listened on")
+    parser.add_argument("--map", help="A map file (see \"maps.loadMap\"), by default a generated one")
+    parser.add_argument("--size", type=int, default=256, help="The side length of the generated map")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the generated map")
+    parser.add_argument("--density", type=float, default=0.25, help="The probability of a cell being a wall")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="square4", help="The movement rule of the generated map")
+    parser.add_argument("--maze", choices=generators.keys(), default="random", help="The generator of the map")
+    parser.add_argument("--workers", type=int, help="The amount of searches running at once")
+    parser.add_argument("--timeout", type=float, default=10.0, help="The default seconds a request waits for its path")
+    args = parser.parse_args()
+
+    if args.map:
+        grid = loadMap(args.map)
+    else:
+        grid, _, _ = buildMap(args.size, args.seed, args.density, args.topology, args.maze)
+    service = SolverService(grid, args.workers, args.timeout)
+    print(f'Serving {grid.rows}x{grid.cols} "{grid.topology}" map on {args.host}:{args.port}')
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == '__main__':
+    main()
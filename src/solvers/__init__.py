@@ -0,0 +1,20 @@
+from .result import SearchResult, pathCost
+from .heuristics import heuristics
+from .astar import aStar
+from .depth_first import depthFirst
+from .breadth_first import breadthFirstSearch
+from .dijkstra import dijkstra
+from .jump_point import jumpPointSearch
+from .any_angle import LineOfSight, thetaStar, lazyThetaStar, smoothPath, euclideanLength
+from .bidirectional import bidirectionalAStar, bidirectionalBreadthFirstSearch
+from .hierarchical import HierarchicalPlanner
+from .incremental import IncrementalPlanner
+from .multi_agent import CooperativePlanner, ReservationTable, ReverseDistance, findConflicts
+from .cache import PathCache
+from .components import ComponentIndex, labelComponents
+from .metrics import Profiler, JsonLinesWriter, searchMetrics
+from .batch import BatchSolver, solveBatch
+try:
+    from .fields import DistanceField, FieldCache, allPairsDistances
+except ImportError: # NumPy is only needed by the distance fields
+    pass
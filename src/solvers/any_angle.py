@@ -0,0 +1,293 @@
+import math
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid, WALL
+from topology import cornerBlocked
+from .heuristics import euclidean
+from .result import SearchResult, buildPath
+
+
+class LineOfSight(object):
+    def __init__(self, grid:Grid, maxsize:int = 65536) -> None:
+        """Checks whether straight segments between cell centers cross any wall, caching the answers
+
+        The cells crossed by a segment are walked with integer arithmetic (a Bresenham
+        traversal that also visits the cells the segment only clips). A segment going
+        exactly through the corner of four cells follows the corner rule of "square8"
+        grids, and may not squeeze between two diagonal walls on "square4" grids.
+
+        The answers are kept until the grid revision changes, or the cache fills up.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid, with "square4" or "square8" topology
+        maxsize : int, optional
+            The maximum amount of segments kept, by default 65536
+        """
+        if grid.topology not in ("square4", "square8"):
+            raise AttributeError(f'Line of sight is not defined on the "{grid.topology}" topology')
+        self.grid = grid
+        self.maxsize = maxsize
+        self.cache = {}
+        self.revision = grid.revision
+
+    def visible(self, a:int, b:int) -> bool:
+        """Indicates whether the segment between two cell centers is clear
+
+        Parameters
+        ----------
+        a : int
+            The first cell index
+        b : int
+            The second cell index
+
+        Returns
+        -------
+        bool
+            True, if the segment does not cross any wall
+        """
+        if self.grid.revision != self.revision:
+            self.cache.clear()
+            self.revision = self.grid.revision
+
+        # The segment crosses the same cells in both directions
+        key = (a, b) if a < b else (b, a)
+        clear = self.cache.get(key)
+        if clear is None:
+            if len(self.cache) >= self.maxsize:
+                self.cache.clear()
+            clear = self.cache[key] = self.trace(a, b) is not None
+        return clear
+
+    def trace(self, a:int, b:int) -> list:
+        """Gets the cells crossed by the segment between two cell centers
+
+        Parameters
+        ----------
+        a : int
+            The first cell index
+        b : int
+            The second cell index
+
+        Returns
+        -------
+        list
+            The cell indices from the first cell to the second one, None if the segment crosses a wall
+        """
+        grid = self.grid
+        cols, cells = grid.cols, grid.cells
+        corner_rule = grid.corner_rule if grid.topology == "square8" else "no-squeeze"
+        if cells[a] == WALL:
+            return None
+
+        row, col = divmod(a, cols)
+        end_row, end_col = divmod(b, cols)
+        n_rows, n_cols = abs(end_row - row), abs(end_col - col)
+        row_step = cols if end_row > row else -cols
+        col_step = 1 if end_col > col else -1
+
+        current, crossed_rows, crossed_cols = a, 0, 0
+        crossed = [a]
+        while crossed_rows < n_rows or crossed_cols < n_cols:
+            # Comparing where the segment crosses the next column border and the next row border
+            decision = ((1 + 2 * crossed_cols) * n_rows) - ((1 + 2 * crossed_rows) * n_cols)
+            if decision == 0:
+                # Going exactly through a corner, between the cells beside the diagonal step
+                if cornerBlocked(corner_rule, cells[current + row_step] == WALL, cells[current + col_step] == WALL):
+                    return None
+                current += row_step + col_step
+                crossed_rows += 1
+                crossed_cols += 1
+            elif decision < 0:
+                current += col_step
+                crossed_cols += 1
+            else:
+                current += row_step
+                crossed_rows += 1
+            if cells[current] == WALL:
+                return None
+            crossed.append(current)
+        return crossed
+
+
+def euclideanLength(grid:Grid, path:list) -> float:
+    """Sums the straight distances between the consecutive cells of a path
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid the path was found on
+    path : list
+        The cell indices of the path, adjacent cells or waypoints
+
+    Returns
+    -------
+    float
+        The length of the path, 0 for an empty one
+    """
+    coords = [divmod(cell, grid.cols) for cell in path]
+    return sum(math.hypot(r2 - r1, c2 - c1) for (r1, c1), (r2, c2) in zip(coords, coords[1:]))
+
+
+def smoothPath(grid:Grid, path:list, sight:LineOfSight = None) -> list:
+    """Shortens a path by string pulling: every cell that can be skipped in a straight line is dropped
+
+    Going along the path, the last waypoint kept is joined to the farthest following cell
+    it can see, so the waypoints only remain where the path bends around a wall.
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid the path was found on
+    path : list
+        The cell indices of the path
+    sight : LineOfSight, optional
+        The line of sight checks, sharing their cache, by default a new one
+
+    Returns
+    -------
+    list
+        The waypoints, from the first cell of the path to the last one
+    """
+    if len(path) < 3:
+        return list(path)
+    if sight is None:
+        sight = LineOfSight(grid)
+
+    waypoints = [path[0]]
+    for cell, following in zip(path[1:], path[2:]):
+        if not sight.visible(waypoints[-1], following):
+            waypoints.append(cell)
+    waypoints.append(path[-1])
+    return waypoints
+
+
+def thetaStar(grid:Grid, start:int, end:int, observer=None, lazy:bool = False, sight:LineOfSight = None) -> SearchResult:
+    """Runs Theta* algorithm, an any-angle variant of A*
+
+    When a neighbor is reached, it is linked straight to the parent of the current cell
+    if the segment between them is clear, else to the current cell as in A*. The paths
+    are then made of waypoints joined by straight segments, shorter than the grid paths
+    in Euclidean length and with far fewer points. The distances are Euclidean, the
+    terrain costs are ignored.
+
+    Lazy Theta* links every neighbor to the parent of the current cell without checking,
+    and only checks the segment when the neighbor is expanded, falling back to its best
+    expanded neighbor when it is blocked. It checks about one segment per expansion instead
+    of one per neighbor.
+
+    Reference = [http://idm-lab.org/bib/abstracts/papers/aaai10b.pdf]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched, with "square4" or "square8" topology
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, the path being every cell
+        crossed by its segments, by default None
+    lazy : bool, optional
+        Whether to run Lazy Theta*, by default False
+    sight : LineOfSight, optional
+        The line of sight checks, sharing their cache between searches, by default a new one
+
+    Returns
+    -------
+    SearchResult
+        The waypoints found and the search statistics
+    """
+    if sight is None:
+        sight = LineOfSight(grid)
+    visible = sight.visible
+    cols = grid.cols
+    end_row, end_col = divmod(end, cols)
+    inf = float("inf")
+
+    def distance(a:int, b:int) -> float:
+        a_row, a_col = divmod(a, cols)
+        b_row, b_col = divmod(b, cols)
+        return math.hypot(a_row - b_row, a_col - b_col)
+
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0) # The points are in different regions
+    expanded = 0
+    came_from = {} # The parent of every reached cell, any cell it sees instead of a neighbor
+    g_score = {start: 0}
+    closed = set()
+
+    # Entries are (f, -g, cell): lowest f first, then highest g
+    open_set = [(euclidean(*divmod(start, cols), end_row, end_col), 0, start)]
+
+    while open_set:
+        _, neg_g, current = heappop(open_set)
+        if current in closed or -neg_g > g_score[current]:
+            continue # Outdated entry, the cell was reached again through a shorter path
+        if lazy and current != start and not visible(came_from[current], current):
+            # The assumed segment is blocked, linking the cell to its best expanded neighbor instead
+            g_score[current], came_from[current] = min(
+                (g_score[neighbor] + distance(neighbor, current), neighbor)
+                for neighbor in grid.neighbors(current) if neighbor in closed
+            )
+        closed.add(current)
+        expanded += 1
+
+        if current == end:
+            waypoints = buildPath(came_from, end)
+            if observer:
+                for a, b in zip(waypoints, waypoints[1:]):
+                    for cell in sight.trace(a, b)[:-1]:
+                        observer(cell, "path")
+                observer(end, "path")
+            return SearchResult(waypoints, expanded, perf_counter() - t0)
+
+        parent = came_from.get(current, current)
+        for neighbor in grid.neighbors(current):
+            if neighbor in closed:
+                continue
+            if lazy or visible(parent, neighbor):
+                source = parent
+            else:
+                source = current
+            temp_g_score = g_score[source] + distance(source, neighbor)
+
+            if temp_g_score < g_score.get(neighbor, inf):
+                if observer and neighbor not in g_score:
+                    observer(neighbor, "watch")
+                came_from[neighbor] = source
+                g_score[neighbor] = temp_g_score
+                row, col = divmod(neighbor, cols)
+                heappush(open_set, (temp_g_score + euclidean(row, col, end_row, end_col), -temp_g_score, neighbor))
+
+        if current != start and observer:
+            observer(current, "visited")
+
+    return SearchResult([], expanded, perf_counter() - t0)
+
+
+def lazyThetaStar(grid:Grid, start:int, end:int, observer=None, sight:LineOfSight = None) -> SearchResult:
+    """Runs Lazy Theta* algorithm, checking about one segment per expansion (see "thetaStar")
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched, with "square4" or "square8" topology
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+    sight : LineOfSight, optional
+        The line of sight checks, sharing their cache between searches, by default a new one
+
+    Returns
+    -------
+    SearchResult
+        The waypoints found and the search statistics
+    """
+    return thetaStar(grid, start, end, observer, lazy=True, sight=sight)
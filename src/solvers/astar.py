@@ -0,0 +1,98 @@
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid
+from .heuristics import getHeuristic
+from .result import SearchResult, buildPath
+
+
+def aStar(grid:Grid, start:int, end:int, observer=None, heuristic=None, weight:float = 1.0) -> SearchResult:
+    """Runs A* algorithm
+
+    One important aspect of A* is f = g + h
+    Where:
+        f is the total cost of the node.
+        g is the distance between the current node and the start node.
+        h is the heuristic - estimated distance from the current node to the end node.
+
+    This algorithm expoits the node with the lowest f and its neighbors. Among nodes
+    with the same f, the one with the highest g (closest to the end) goes first.
+
+    Every step costs the cost of the cell entered (see "Grid.setCost"), times sqrt(2)
+    for diagonal steps. Costs are at least 1, so the heuristics stay admissible.
+
+    The open set is a binary heap where improved nodes are pushed again instead of
+    being updated, the outdated entries are skipped when they are popped. Every entry
+    is popped or left in the heap, so only the pops are counted.
+
+    Reference = [https://medium.com/@nicholas.w.swift/easy-a-star-pathfinding-7e6689c7f7b2]
+    Code adapted from = [https://morioh.com/p/cf0c6b11c848?f=5c21fb01c16e2556b555ab32]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+    heuristic : str or callable, optional
+        A name of "heuristics.heuristics" or a function (row1, col1, row2, col2) -> cost,
+        by default the admissible heuristic of the grid topology
+    weight : float, optional
+        Weighted A* factor multiplying h. Values above 1 expand fewer nodes and
+        return paths at most "weight" times longer than the shortest, by default 1.0
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    cols = grid.cols
+    end_row, end_col = divmod(end, cols)
+    h = getHeuristic(heuristic, grid.topology)
+    costs = grid.costs
+    inf = float("inf")
+
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0, 0, 0, 0) # The points are in different regions
+    expanded = pops = peak_open = 0
+    came_from = {}
+    g_score = {start: 0} # Only the reached cells, so a short query never touches the whole grid
+
+    # Entries are (f, -g, cell): lowest f first, then highest g
+    open_set = [(weight * h(*divmod(start, cols), end_row, end_col), 0, start)]
+
+    while open_set:
+        if len(open_set) > peak_open:
+            peak_open = len(open_set) # The open set is largest right before a pop
+        _, neg_g, current = heappop(open_set)
+        pops += 1
+        if -neg_g > g_score[current]:
+            continue # Outdated entry, the cell was reached again through a shorter path
+        expanded += 1
+
+        if current == end:
+            path = buildPath(came_from, end, observer)
+            return SearchResult(path, expanded, perf_counter() - t0, pops + len(open_set), pops, peak_open)
+
+        current_g = g_score[current]
+        for neighbor, step in grid.steps(current):
+            if costs is not None:
+                step *= costs[neighbor]
+            temp_g_score = current_g + step
+
+            if temp_g_score < g_score.get(neighbor, inf):
+                if observer and neighbor not in g_score:
+                    observer(neighbor, "watch")
+                came_from[neighbor] = current
+                g_score[neighbor] = temp_g_score
+                row, col = divmod(neighbor, cols)
+                heappush(open_set, (temp_g_score + weight * h(row, col, end_row, end_col), -temp_g_score, neighbor))
+
+        if current != start and observer:
+            observer(current, "visited")
+
+    return SearchResult([], expanded, perf_counter() - t0, pops, pops, peak_open)
@@ -0,0 +1,194 @@
+import os
+from multiprocessing import Pool, util
+from multiprocessing.shared_memory import SharedMemory
+from grid import Grid
+from .astar import aStar
+
+
+# The grid and solver of a worker process, set once by "attachWorker"
+worker = {}
+
+
+def attachWorker(name:str, rows:int, cols:int, topology:str, corner_rule:str, costs:bool, search, kwargs:dict) -> None:
+    """Initializes a worker process with a grid viewing the shared memory block
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block holding the cells
+    rows : int
+        Amount of vertical cells
+    cols : int
+        Amount of horizontal cells
+    topology : str
+        The topology of the grid
+    corner_rule : str
+        The rule for diagonal moves beside walls
+    costs : bool
+        Whether the costs of the cells follow the state codes in the block
+    search : callable
+        The solver to run, e.g. "solvers.aStar"
+    kwargs : dict
+        The extra arguments given to the solver
+    """
+    memory = SharedMemory(name=name)
+    worker["memory"] = memory # Keeping a reference so the block stays mapped
+    size = rows * cols
+    worker["costs"] = memory.buf[size:2 * size] if costs else None
+    worker["grid"] = Grid(rows, cols, topology, cells=memory.buf, costs=worker["costs"], corner_rule=corner_rule)
+    worker["search"] = search
+    worker["kwargs"] = kwargs
+    # Pool workers leave through os._exit, skipping "atexit", but they still run the multiprocessing finalizers
+    util.Finalize(None, detachWorker, exitpriority=0)
+
+
+def detachWorker() -> None:
+    """Releases the views of the shared memory block of a worker process, then unmaps it
+
+    The block can only be closed once no view of it is left, else its garbage collection
+    complains about exported pointers when the worker exits.
+    """
+    memory = worker.pop("memory", None)
+    if memory is None:
+        return
+    del worker["grid"]
+    costs = worker.pop("costs")
+    if costs is not None:
+        costs.release()
+    memory.close()
+
+
+def solveQuery(query:tuple) -> tuple:
+    """Solves a single query in a worker process
+
+    Parameters
+    ----------
+    query : tuple
+        The position of the query in the batch, the starting and the ending cell indices
+
+    Returns
+    -------
+    tuple
+        The position of the query and its SearchResult
+    """
+    position, start, end = query
+    return position, worker["search"](worker["grid"], start, end, **worker["kwargs"])
+
+
+class BatchSolver(object):
+    def __init__(self, grid:Grid, search = aStar, workers:int = None, **kwargs) -> None:
+        """Solves many queries against a snapshot of a grid with a pool of processes
+
+        The cells, and their costs if any, are copied once into a shared memory block that
+        every worker maps, so only the query tuples and the results travel between processes.
+        Use it as a context manager, or call "close" when done.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid to be searched, later changes to it are not seen by the workers
+        search : callable, optional
+            The solver to run, by default "solvers.aStar"
+        workers : int, optional
+            Amount of worker processes, by default the amount of CPUs
+        kwargs
+            The extra arguments given to the solver, e.g. heuristic
+        """
+        self.workers = workers or os.cpu_count() or 1
+        size = len(grid)
+        costs = grid.costs is not None
+        self.memory = SharedMemory(create=True, size=max(size * (2 if costs else 1), 1))
+        self.memory.buf[:size] = grid.cells[:size]
+        if costs:
+            self.memory.buf[size:2 * size] = grid.costs[:size]
+        self.pool = Pool(
+            self.workers,
+            initializer=attachWorker,
+            initargs=(self.memory.name, grid.rows, grid.cols, grid.topology, grid.corner_rule, costs, search, kwargs)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def chunksize(self, amount:int) -> int:
+        """Gets how many queries are sent to a worker at once, about four chunks per worker
+
+        Parameters
+        ----------
+        amount : int
+            Amount of queries
+
+        Returns
+        -------
+        int
+            The chunk size
+        """
+        return max(1, amount // (self.workers * 4))
+
+    def solve(self, queries:list) -> list:
+        """Solves the queries, returning the results in the same order
+
+        Parameters
+        ----------
+        queries : list
+            The (start, end) cell index pairs
+
+        Returns
+        -------
+        list
+            The SearchResult of each query
+        """
+        tasks = [(position, start, end) for position, (start, end) in enumerate(queries)]
+        return [result for _, result in self.pool.imap(solveQuery, tasks, self.chunksize(len(tasks)))]
+
+    def stream(self, queries:list):
+        """Solves the queries, yielding each result as soon as it is ready
+
+        Parameters
+        ----------
+        queries : list
+            The (start, end) cell index pairs
+
+        Yields
+        ------
+        tuple
+            The position of the query in "queries" and its SearchResult
+        """
+        tasks = [(position, start, end) for position, (start, end) in enumerate(queries)]
+        yield from self.pool.imap_unordered(solveQuery, tasks, self.chunksize(len(tasks)))
+
+    def close(self) -> None:
+        """Stops the workers and releases the shared memory block
+        """
+        self.pool.close()
+        self.pool.join()
+        self.memory.close()
+        self.memory.unlink()
+
+
+def solveBatch(grid:Grid, queries:list, search = aStar, workers:int = None, **kwargs) -> list:
+    """Solves many queries against a grid with a pool of processes
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    queries : list
+        The (start, end) cell index pairs
+    search : callable, optional
+        The solver to run, by default "solvers.aStar"
+    workers : int, optional
+        Amount of worker processes, by default the amount of CPUs
+    kwargs
+        The extra arguments given to the solver, e.g. heuristic
+
+    Returns
+    -------
+    list
+        The SearchResult of each query, in the same order
+    """
+    with BatchSolver(grid, search, workers, **kwargs) as batch:
+        return batch.solve(queries)
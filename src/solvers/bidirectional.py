@@ -0,0 +1,173 @@
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid
+from .heuristics import getHeuristic
+from .result import SearchResult, buildBidirectionalPath
+
+
+def bidirectionalBreadthFirstSearch(grid:Grid, start:int, end:int, observer=None) -> SearchResult:
+    """Runs Bidirectional Breadth-First Search algorithm
+
+    Two breadth-first searches grow from the starting and the ending points, always
+    expanding a whole depth level of the smaller frontier, until they meet in the middle.
+    The explored area is about two circles of half the radius of a single search.
+
+    Reference = [https://en.wikipedia.org/wiki/Bidirectional_search]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0) # The points are in different regions
+    if start == end:
+        return SearchResult([start], 1, perf_counter() - t0)
+
+    expanded = 0
+    came_from = ({}, {}) # Per direction: from the start, from the end
+    depth = ({start: 0}, {end: 0})
+    frontiers = ([start], [end])
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parents, own_depth, other_depth = came_from[side], depth[side], depth[1 - side]
+        best, meeting = float("inf"), None
+        next_frontier = []
+
+        # The whole level is expanded so the meeting with the shortest total depth is kept
+        for current in frontiers[side]:
+            expanded += 1
+            for neighbor in grid.neighbors(current):
+                if neighbor in own_depth:
+                    continue
+                own_depth[neighbor] = own_depth[current] + 1
+                parents[neighbor] = current
+                next_frontier.append(neighbor)
+                if neighbor in other_depth:
+                    total = own_depth[neighbor] + other_depth[neighbor]
+                    if total < best:
+                        best, meeting = total, neighbor
+                elif observer:
+                    observer(neighbor, "watch")
+
+            if current != start and current != end and observer:
+                observer(current, "visited")
+
+        if meeting is not None:
+            path = buildBidirectionalPath(came_from[0], came_from[1], meeting, observer)
+            return SearchResult(path, expanded, perf_counter() - t0)
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+
+    return SearchResult([], expanded, perf_counter() - t0)
+
+
+def bidirectionalAStar(grid:Grid, start:int, end:int, observer=None, heuristic=None) -> SearchResult:
+    """Runs Bidirectional A* algorithm
+
+    Two A* searches run toward each other, the forward one estimating the distance to
+    the ending point and the backward one the distance to the starting point. Each
+    step expands the direction with the smaller open set. Every time a cell reached
+    by one direction is relaxed by the other, the total cost becomes a candidate path.
+    The search stops when the lowest f of either direction can no longer beat the
+    best candidate, which keeps the path the shortest one for consistent heuristics.
+
+    Every step costs the cost of the cell entered (see "Grid.setCost"), times sqrt(2)
+    for diagonal steps: the backward search, walking the steps in reverse, pays for
+    the cell it comes from.
+
+    Reference = [https://en.wikipedia.org/wiki/Bidirectional_search]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+    heuristic : str or callable, optional
+        A name of "heuristics.heuristics" or a function (row1, col1, row2, col2) -> cost,
+        by default the admissible heuristic of the grid topology
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    cols = grid.cols
+    h = getHeuristic(heuristic, grid.topology)
+    costs = grid.costs
+    targets = (divmod(end, cols), divmod(start, cols)) # Per direction: from the start, from the end
+
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0) # The points are in different regions
+    expanded = 0
+    came_from = ({}, {})
+    g_score = ({start: 0}, {end: 0})
+    closed = (set(), set())
+    open_sets = (
+        [(h(*targets[1], *targets[0]), 0, start)],
+        [(h(*targets[0], *targets[1]), 0, end)],
+    )
+    best, meeting = float("inf"), None
+    if start == end:
+        best, meeting = 0, start
+
+    while open_sets[0] and open_sets[1]:
+        # Dropping the outdated entries so the top of each heap holds its lowest f
+        for side in (0, 1):
+            while open_sets[side] and open_sets[side][0][2] in closed[side]:
+                heappop(open_sets[side])
+        if not (open_sets[0] and open_sets[1]):
+            break
+        if best <= max(open_sets[0][0][0], open_sets[1][0][0]):
+            break
+
+        side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+        open_set, own_g, other_g = open_sets[side], g_score[side], g_score[1 - side]
+        target_row, target_col = targets[side]
+
+        _, neg_g, current = heappop(open_set)
+        closed[side].add(current)
+        expanded += 1
+
+        current_g = -neg_g
+        for neighbor, step in grid.steps(current):
+            if costs is not None:
+                step *= costs[neighbor if side == 0 else current]
+            temp_g_score = current_g + step
+
+            if temp_g_score < own_g.get(neighbor, float("inf")):
+                if observer and neighbor not in own_g and neighbor not in other_g:
+                    observer(neighbor, "watch")
+                came_from[side][neighbor] = current
+                own_g[neighbor] = temp_g_score
+                row, col = divmod(neighbor, cols)
+                heappush(open_set, (temp_g_score + h(row, col, target_row, target_col), -temp_g_score, neighbor))
+
+                if neighbor in other_g and temp_g_score + other_g[neighbor] < best:
+                    best, meeting = temp_g_score + other_g[neighbor], neighbor
+
+        if current != start and current != end and observer:
+            observer(current, "visited")
+
+    if meeting is None:
+        return SearchResult([], expanded, perf_counter() - t0)
+    path = buildBidirectionalPath(came_from[0], came_from[1], meeting, observer)
+    return SearchResult(path, expanded, perf_counter() - t0)
@@ -0,0 +1,62 @@
+from collections import deque
+from time import perf_counter
+from grid import Grid
+from .result import SearchResult, buildPath
+
+
+def breadthFirstSearch(grid:Grid, start:int, end:int, observer=None) -> SearchResult:
+    """Runs Breadth-First Search Algorithm
+
+    This algorithm explores all of the neighbor nodes at the present
+    depth prior to moving on to the nodes at the next depth level.
+
+    Reference = [https://en.wikipedia.org/wiki/Breadth-first_search]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0, 0, 0, 0) # The points are in different regions
+    expanded = peak_open = 0
+    came_from = {}
+    open_set = deque([start]) # The FIFO data structure for exploring all of the neighbor nodes as soon as they shows up
+    seen = bytearray(len(grid)) # Flags the cells that already went into the open set
+    seen[start] = 1
+
+    while open_set:
+        if len(open_set) > peak_open:
+            peak_open = len(open_set) # The queue is largest right before a pop
+        current = open_set.popleft()
+        expanded += 1
+
+        if current == end:
+            path = buildPath(came_from, end, observer)
+            # Every cell seen was pushed once, and every pop expands a cell
+            return SearchResult(path, expanded, perf_counter() - t0, seen.count(1), expanded, peak_open)
+
+        for neighbor in grid.neighbors(current):
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                open_set.append(neighbor)
+                came_from[neighbor] = current
+                if observer:
+                    observer(neighbor, "watch")
+
+        if current != start and observer:
+            observer(current, "visited")
+
+    return SearchResult([], expanded, perf_counter() - t0, expanded, expanded, peak_open)
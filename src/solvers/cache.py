@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from time import perf_counter
+from grid import Grid
+from .result import SearchResult
+
+
+class PathCache(object):
+    def __init__(self, grid:Grid, maxsize:int = 256) -> None:
+        """A least-recently-used cache of the paths found on a grid
+
+        Entries are keyed on the algorithm, its extra arguments, the starting and ending
+        points and the grid revision, which is bumped on every wall change. Entries of an
+        older revision are dropped as soon as the walls change, so a stale path is never served.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid whose paths are cached
+        maxsize : int, optional
+            The maximum amount of paths kept, by default 256
+        """
+        self.grid = grid
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.revision = grid.revision
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, search, start:int, end:int, kwargs:dict) -> tuple:
+        """Builds the key of a query, dropping every entry if the grid changed since the last one
+
+        Parameters
+        ----------
+        search : callable
+            The solver
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        kwargs : dict
+            The extra arguments given to the solver
+
+        Returns
+        -------
+        tuple
+            The cache key
+        """
+        if self.grid.revision != self.revision:
+            self.entries.clear()
+            self.revision = self.grid.revision
+        return (search, tuple(sorted(kwargs.items())), start, end, self.revision)
+
+    def get(self, search, start:int, end:int, **kwargs) -> SearchResult:
+        """Gets the cached result of a query
+
+        Parameters
+        ----------
+        search : callable
+            The solver, e.g. "solvers.aStar"
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        kwargs
+            The extra arguments given to the solver, e.g. heuristic
+
+        Returns
+        -------
+        SearchResult
+            A copy of the cached result, with no expanded nodes, or None on a miss
+        """
+        t0 = perf_counter()
+        key = self.key(search, start, end, kwargs)
+        path = self.entries.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return SearchResult(list(path), 0, perf_counter() - t0)
+
+    def put(self, search, start:int, end:int, result:SearchResult, **kwargs) -> None:
+        """Caches the result of a query, evicting the least recently used one when full
+
+        Parameters
+        ----------
+        search : callable
+            The solver, e.g. "solvers.aStar"
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        result : SearchResult
+            The result of the solver
+        kwargs
+            The extra arguments given to the solver, e.g. heuristic
+        """
+        key = self.key(search, start, end, kwargs)
+        self.entries[key] = tuple(result.path)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def solve(self, search, start:int, end:int, **kwargs) -> SearchResult:
+        """Gets the cached result of a query, running the solver on a miss
+
+        Parameters
+        ----------
+        search : callable
+            The solver, e.g. "solvers.aStar"
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        kwargs
+            The extra arguments given to the solver, e.g. heuristic or observer
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics
+        """
+        observer = kwargs.pop("observer", None)
+        result = self.get(search, start, end, **kwargs)
+        if result is None:
+            result = search(self.grid, start, end, observer=observer, **kwargs)
+            self.put(search, start, end, result, **kwargs)
+        elif observer:
+            for cell in result.path:
+                observer(cell, "path")
+        return result
+
+    def info(self) -> dict:
+        """Gets the cache statistics
+
+        Returns
+        -------
+        dict
+            The hits, misses, hit ratio, current size and maximum size
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics
+        """
+        self.entries.clear()
+        self.hits = self.misses = 0
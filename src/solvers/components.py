@@ -0,0 +1,255 @@
+import math
+from grid import Grid, WALL
+from topology import moveTable, cornerBlocked
+
+
+def labelComponents(grid:Grid):
+    """Labels the connected regions of open cells, vectorized with NumPy
+
+    Every move between two open cells is an edge of a union-find forest kept in one array:
+    each round hooks the root of the larger label under the smaller one for all the edges
+    at once, then jumps the pointers until every cell points at its root. The edges whose
+    cells share a root are dropped, so the rounds quickly get cheaper.
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid
+
+    Returns
+    -------
+    np.ndarray
+        The label of every cell, the smallest index of its region, -1 for walls
+    """
+    import numpy as np
+
+    size, cols = len(grid), grid.cols
+    is_open = np.frombuffer(grid.cells, dtype=np.uint8, count=size) != WALL
+    col_of = np.arange(size, dtype=np.int64) % cols
+    open_cells = np.flatnonzero(is_open)
+
+    # Every edge once, from the cell whose move goes forward in index order
+    firsts, seconds = [], []
+    corner_checks = grid.topology == "square8" and grid.corner_rule != "cut"
+    parities = (0, 1) if grid.topology == "hex" else (0,)
+    for parity in parities:
+        cells = open_cells if len(parities) == 1 else open_cells[(col_of[open_cells] & 1) == parity]
+        for d_row, d_col, _ in moveTable(grid.topology, parity):
+            if (d_row, d_col) < (0, 0):
+                continue
+            neighbors = cells + (d_row * cols) + d_col
+            valid = (neighbors >= 0) & (neighbors < size)
+            valid &= (col_of[cells] + d_col >= 0) & (col_of[cells] + d_col < cols)
+            valid[valid] &= is_open[neighbors[valid]]
+            if corner_checks and d_row and d_col:
+                beside = cells[valid]
+                valid[valid] = ~cornerBlocked(
+                    grid.corner_rule, ~is_open[beside + (d_row * cols)], ~is_open[beside + d_col]
+                )
+            firsts.append(cells[valid])
+            seconds.append(neighbors[valid])
+
+    parent = np.arange(size, dtype=np.int64)
+    firsts, seconds = np.concatenate(firsts), np.concatenate(seconds)
+    while firsts.size:
+        first_roots, second_roots = parent[firsts], parent[seconds]
+        apart = first_roots != second_roots
+        if not apart.any():
+            break
+        firsts, seconds = firsts[apart], seconds[apart]
+        first_roots, second_roots = first_roots[apart], second_roots[apart]
+        np.minimum.at(parent, np.maximum(first_roots, second_roots), np.minimum(first_roots, second_roots))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+    parent[~is_open] = -1
+    return parent
+
+
+def ringTable(topology:str, parity:int) -> tuple:
+    """Gets the cells around a cell, in circular order
+
+    Two consecutive cells of the ring are always adjacent, through a move that no wall
+    in the middle of the ring can forbid.
+
+    Parameters
+    ----------
+    topology : str
+        The movement rule, one of "topology.TOPOLOGIES"
+    parity : int
+        0 for cells in even columns, 1 for odd ones
+
+    Returns
+    -------
+    tuple
+        The (d_row, d_col, adjacent) of every cell of the ring, adjacent being whether
+        the cell can be a neighbor of the middle one
+    """
+    if topology == "hex":
+        # Sorting the neighbors by their angle, the odd columns being shifted half a cell down
+        def angle(move:tuple) -> float:
+            d_row, d_col, _ = move
+            return math.atan2(d_row + 0.5 * (((parity + d_col) & 1) - parity), d_col)
+        return tuple((d_row, d_col, True) for d_row, d_col, _ in sorted(moveTable(topology, parity), key=angle))
+
+    ring = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+    return tuple((d_row, d_col, topology == "square8" or not (d_row and d_col)) for d_row, d_col in ring)
+
+
+class ComponentIndex(object):
+    def __init__(self, grid:Grid) -> None:
+        """The connected regions of the open cells of a grid, answering whether two cells are
+        connected in O(1) so the solvers reject the unreachable queries before searching
+
+        The index attaches itself to the grid as "Grid.components" and follows its walls:
+        an opened cell merges the regions around it through a union-find of the labels,
+        and a new wall keeps the labels unless the cells around it stop forming a single
+        arc, in which case the region may have split. Labels are only recomputed (see
+        "labelComponents") when a query relies on such a region, or after many cells changed.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid, whose "components" becomes this index
+        """
+        self.grid = grid
+        self.labels = None # Computed by the first query
+        self.merged = {} # The label each merged label was joined to
+        self.next_label = len(grid) # Labels given to the cells opened alone, above every cell index
+        self.split = False # Whether a wall may have split a region since the labeling
+        self.rings = None
+        grid.components = self
+        grid.addWallListener(self.onWallChanged)
+
+    def close(self) -> None:
+        """Detaches the index from the grid
+        """
+        self.grid.removeWallListener(self.onWallChanged)
+        if self.grid.components is self:
+            self.grid.components = None
+
+    def relabel(self) -> None:
+        """Labels the regions from scratch
+        """
+        self.labels = labelComponents(self.grid)
+        self.merged.clear()
+        self.split = False
+        self.rings = (ringTable(self.grid.topology, 0), ringTable(self.grid.topology, 1))
+
+    def find(self, cell:int) -> int:
+        """Gets the label of the region of a cell
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+
+        Returns
+        -------
+        int
+            The label, -1 for walls
+        """
+        label = root = int(self.labels[cell])
+        merged = self.merged
+        while root in merged:
+            root = merged[root]
+        while label != root: # Compressing the chain of merged labels
+            merged[label], label = root, merged[label]
+        return root
+
+    def connected(self, a:int, b:int) -> bool:
+        """Indicates whether a path may join two cells
+
+        Parameters
+        ----------
+        a : int
+            The first cell index
+        b : int
+            The second cell index
+
+        Returns
+        -------
+        bool
+            False, if no path can join the cells, e.g. a cell walled off or a wall
+        """
+        if a == b:
+            return True
+        if self.labels is None:
+            self.relabel()
+        first = self.find(a)
+        if first < 0 or first != self.find(b):
+            return False
+        if self.split:
+            # The walls added since the labeling may have cut the region in two
+            self.relabel()
+            return self.find(a) == self.find(b)
+        return True
+
+    def onWallChanged(self, idx:int) -> None:
+        """Updates the labels around a cell that became or stopped being a wall
+
+        Parameters
+        ----------
+        idx : int
+            The cell index, None when many cells changed (or the topology) to label everything again
+        """
+        if self.labels is None:
+            return
+        if idx is None:
+            self.labels = None
+            return
+
+        grid = self.grid
+        was_wall = self.labels[idx] < 0
+        if grid.cells[idx] == WALL and not was_wall:
+            self.labels[idx] = -1
+            if not self.split and not self.ringConnected(idx):
+                self.split = True
+        elif grid.cells[idx] != WALL and was_wall:
+            roots = {self.find(neighbor) for neighbor in grid.neighbors(idx)}
+            if roots:
+                root = min(roots)
+                for other in roots - {root}:
+                    self.merged[other] = root
+            else:
+                root = self.next_label
+                self.next_label += 1
+            self.labels[idx] = root
+
+    def ringConnected(self, idx:int) -> bool:
+        """Indicates whether the open cells around a new wall still join each other around it
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        bool
+            True, if the neighbors of the cell lie on a single arc of open cells around it,
+            so the wall can not split their region
+        """
+        grid = self.grid
+        cells, rows, cols = grid.cells, grid.rows, grid.cols
+        row, col = divmod(idx, cols)
+        ring = []
+        for d_row, d_col, adjacent in self.rings[col & 1]:
+            inside = 0 <= row + d_row < rows and 0 <= col + d_col < cols
+            ring.append((inside and cells[idx + (d_row * cols) + d_col] != WALL, adjacent))
+        if all(is_open for is_open, _ in ring):
+            return True
+
+        # Walking the ring from a closed cell, counting the arcs holding a neighbor
+        first_closed = next(position for position, (is_open, _) in enumerate(ring) if not is_open)
+        arcs, holds_neighbor = 0, False
+        for is_open, adjacent in ring[first_closed + 1:] + ring[:first_closed + 1]:
+            if is_open:
+                holds_neighbor |= adjacent
+            else:
+                arcs += holds_neighbor
+                holds_neighbor = False
+        return arcs <= 1
@@ -0,0 +1,62 @@
+from time import perf_counter
+from grid import Grid
+from .result import SearchResult, buildPath
+
+
+def depthFirst(grid:Grid, start:int, end:int, observer=None) -> SearchResult:
+    """Runs Depth-First Search Algorithm
+
+    This algorithm explores as far as possible along each branch of a tree (or graph) before backtracking.
+
+    Reference = [https://en.wikipedia.org/wiki/Depth-first_search]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0, 0, 0, 0) # The points are in different regions
+    expanded = pops = peak_open = 0
+    came_from = {}
+    open_set = [start] # The LIFO data structure for exploring as far as possible along each branch
+    visited = bytearray(len(grid)) # Flags the cells that were already explored
+
+    while open_set:
+        if len(open_set) > peak_open:
+            peak_open = len(open_set) # The stack is largest right before a pop
+        current = open_set.pop(-1)
+        pops += 1
+        if visited[current]:
+            # A cell can be stacked more than once, but only its most recent occurrence is explored
+            continue
+        visited[current] = 1
+        expanded += 1
+
+        if current == end:
+            path = buildPath(came_from, end, observer)
+            return SearchResult(path, expanded, perf_counter() - t0, pops + len(open_set), pops, peak_open)
+
+        for neighbor in grid.neighbors(current):
+            if not visited[neighbor]:
+                came_from[neighbor] = current
+                open_set.append(neighbor)
+                if observer:
+                    observer(neighbor, "watch")
+
+        if current != start and observer:
+            observer(current, "visited")
+
+    return SearchResult([], expanded, perf_counter() - t0, pops, pops, peak_open)
@@ -0,0 +1,91 @@
+from time import perf_counter
+from grid import Grid, MAX_COST
+from .astar import aStar
+from .result import SearchResult, buildPath
+
+
+def noHeuristic(row1:int, col1:int, row2:int, col2:int) -> int:
+    """Estimates every cost as 0, turning A* into Dijkstra's Algorithm
+    """
+    return 0
+
+
+def dijkstra(grid:Grid, start:int, end:int, observer=None) -> SearchResult:
+    """Runs Dijkstra's Algorithm
+
+    This algorithm expands the nodes in order of their distance from the starting
+    point, the distance being the sum of the costs of the cells entered
+    (see "Grid.setCost"), so it returns the cheapest path over any terrain.
+
+    Step costs are integers on "square4" and "hex" grids, so the open set is a bucket
+    queue (Dial's algorithm): a circular array of max_cost + 1 lists indexed by the
+    distance, every node being pushed and popped in O(1). Diagonal steps cost sqrt(2)
+    on "square8" grids, which are searched by A* without heuristic instead.
+
+    Reference = [https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    if grid.topology == "square8":
+        return aStar(grid, start, end, observer, heuristic=noHeuristic)
+
+    costs = grid.costs
+    max_cost = 1 if costs is None else MAX_COST # A bound is enough, scanning the costs would touch the whole grid
+    inf = float("inf")
+
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0) # The points are in different regions
+    expanded = 0
+    came_from = {}
+    distances = {start: 0} # Only the reached cells, so a short query never touches the whole grid
+
+    # The bucket of distance d is buckets[d % len(buckets)], every pending node being
+    # at most max_cost away from the one expanded
+    buckets = [[] for _ in range(max_cost + 1)]
+    buckets[0].append(start)
+    pending = 1
+    distance = 0
+
+    while pending:
+        bucket = buckets[distance % len(buckets)]
+        while bucket:
+            current = bucket.pop()
+            pending -= 1
+            if distances[current] != distance:
+                continue # Outdated entry, the cell was reached again through a shorter path
+            expanded += 1
+
+            if current == end:
+                path = buildPath(came_from, end, observer)
+                return SearchResult(path, expanded, perf_counter() - t0)
+
+            for neighbor in grid.neighbors(current):
+                temp_distance = distance + (1 if costs is None else costs[neighbor])
+                if temp_distance < distances.get(neighbor, inf):
+                    if observer and neighbor not in distances:
+                        observer(neighbor, "watch")
+                    came_from[neighbor] = current
+                    distances[neighbor] = temp_distance
+                    buckets[temp_distance % len(buckets)].append(neighbor)
+                    pending += 1
+
+            if current != start and observer:
+                observer(current, "visited")
+        distance += 1
+
+    return SearchResult([], expanded, perf_counter() - t0)
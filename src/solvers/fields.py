@@ -0,0 +1,199 @@
+from collections import OrderedDict
+import numpy as np
+from grid import Grid, WALL
+from topology import moveTable, cornerBlocked
+
+
+class DistanceField(object):
+    def __init__(self, grid:Grid, sources:list) -> None:
+        """The distance from every cell to the nearest of some source cells, and the way there
+
+        The field is computed by a wavefront expansion vectorized with NumPy: every round
+        relaxes all the neighbors of the cells improved in the previous round at once.
+        With unit costs it is a breadth-first search, each cell being settled once; with
+        diagonal moves or terrain costs (see "Grid.setCost") the rounds keep correcting
+        the cells reached by a cheaper route.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid
+        sources : list
+            The cell indices the distances are measured to
+        """
+        self.grid = grid
+        self.sources = tuple(sources)
+        self.revision = grid.revision
+
+        rows, cols, size = grid.rows, grid.cols, len(grid)
+        is_open = np.frombuffer(grid.cells, dtype=np.uint8, count=size) != WALL
+        col_of = np.arange(size, dtype=np.int64) % cols
+        # Moving from a cell toward the sources enters the cell it was relaxed from
+        entry_costs = None if grid.costs is None else np.frombuffer(grid.costs, dtype=np.uint8, count=size)
+
+        distances = np.full(size, np.inf)
+        next_cell = np.full(size, -1, dtype=np.int64)
+        active = np.unique(np.asarray(self.sources, dtype=np.int64))
+        distances[active] = 0
+
+        moves = {parity: moveTable(grid.topology, parity) for parity in (0, 1)}
+        corner_checks = grid.topology == "square8" and grid.corner_rule != "cut"
+        parities = (0, 1) if grid.topology == "hex" else (0,)
+        while active.size:
+            targets, origins, costs = [], [], []
+            for parity in parities:
+                cells = active if len(parities) == 1 else active[(col_of[active] & 1) == parity]
+                for d_row, d_col, cost in moves[parity]:
+                    neighbors = cells + (d_row * cols) + d_col
+                    valid = (neighbors >= 0) & (neighbors < size)
+                    valid &= (col_of[cells] + d_col >= 0) & (col_of[cells] + d_col < cols)
+                    valid[valid] &= is_open[neighbors[valid]]
+                    if corner_checks and d_row and d_col:
+                        # The cells beside a diagonal move are inside the grid whenever its target is
+                        beside = cells[valid]
+                        blocked = cornerBlocked(
+                            grid.corner_rule, ~is_open[beside + (d_row * cols)], ~is_open[beside + d_col]
+                        )
+                        valid[valid] = ~blocked
+                    targets.append(neighbors[valid])
+                    origins.append(cells[valid])
+                    if entry_costs is None:
+                        costs.append(distances[cells[valid]] + cost)
+                    else:
+                        costs.append(distances[cells[valid]] + (cost * entry_costs[cells[valid]]))
+
+            targets, origins, costs = np.concatenate(targets), np.concatenate(origins), np.concatenate(costs)
+            # Keeping the cheapest candidate of each target, then only the ones that improve it
+            order = np.lexsort((costs, targets))
+            targets, origins, costs = targets[order], origins[order], costs[order]
+            first = np.ones(targets.size, dtype=bool)
+            first[1:] = targets[1:] != targets[:-1]
+            targets, origins, costs = targets[first], origins[first], costs[first]
+            better = costs < distances[targets] - 1e-9
+
+            active = targets[better]
+            distances[active] = costs[better]
+            next_cell[active] = origins[better]
+
+        self.distances = distances.reshape(rows, cols)
+        self.next_cell = next_cell.reshape(rows, cols)
+
+    def distance(self, idx:int) -> float:
+        """Gets the distance from a cell to the nearest source
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        float
+            The distance, inf if no source is reachable
+        """
+        return float(self.distances.flat[idx])
+
+    def direction(self, idx:int) -> tuple:
+        """Gets the step to take from a cell toward the nearest source
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        tuple
+            The (d_row, d_col) step, (0, 0) on sources and unreachable cells
+        """
+        following = int(self.next_cell.flat[idx])
+        if following < 0:
+            return (0, 0)
+        row, col = divmod(idx, self.grid.cols)
+        f_row, f_col = divmod(following, self.grid.cols)
+        return (f_row - row, f_col - col)
+
+    def pathFrom(self, start:int) -> list:
+        """Follows the flow field from a cell to the nearest source, in O(path length)
+
+        Parameters
+        ----------
+        start : int
+            The starting cell index
+
+        Returns
+        -------
+        list
+            The cell indices from the starting cell to a source, empty if none is reachable
+        """
+        if self.distances.flat[start] == np.inf:
+            return []
+        next_cell = self.next_cell.reshape(-1)
+        path = [start]
+        while next_cell[path[-1]] >= 0:
+            path.append(int(next_cell[path[-1]]))
+        return path
+
+
+def allPairsDistances(grid:Grid, cells:list) -> np.ndarray:
+    """Computes the distances between every pair of some cells, one field per cell
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid
+    cells : list
+        The cell indices
+
+    Returns
+    -------
+    np.ndarray
+        A len(cells) x len(cells) matrix, inf for the unreachable pairs
+    """
+    cells = np.asarray(cells, dtype=np.int64)
+    return np.stack([DistanceField(grid, [cell]).distances.reshape(-1)[cells] for cell in cells])
+
+
+class FieldCache(object):
+    def __init__(self, grid:Grid, maxsize:int = 16) -> None:
+        """A least-recently-used cache of the distance fields of a grid
+
+        The fields are dropped as soon as the grid revision changes.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid whose fields are cached
+        maxsize : int, optional
+            The maximum amount of fields kept, by default 16
+        """
+        self.grid = grid
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.revision = grid.revision
+
+    def get(self, sources:list) -> DistanceField:
+        """Gets the field of some sources, computing it on a miss
+
+        Parameters
+        ----------
+        sources : list
+            The cell indices the distances are measured to
+
+        Returns
+        -------
+        DistanceField
+            The distance field
+        """
+        if self.grid.revision != self.revision:
+            self.entries.clear()
+            self.revision = self.grid.revision
+
+        key = tuple(sorted(set(sources)))
+        field = self.entries.get(key)
+        if field is None:
+            field = self.entries[key] = DistanceField(self.grid, key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        self.entries.move_to_end(key)
+        return field
@@ -0,0 +1,81 @@
+import math
+from topology import SQRT2
+
+
+# Every heuristic estimates the cost between the cells (row1, col1) and (row2, col2)
+# without ever overestimating it, so A* keeps returning the shortest paths.
+
+
+def manhattan(row1:int, col1:int, row2:int, col2:int) -> int:
+    """Admissible for horizontal and vertical unit moves ("square4" grids)
+    """
+    return abs(row1 - row2) + abs(col1 - col2)
+
+
+def octile(row1:int, col1:int, row2:int, col2:int) -> float:
+    """Admissible when diagonal moves cost sqrt(2) ("square8" grids)
+    """
+    d_row, d_col = abs(row1 - row2), abs(col1 - col2)
+    return max(d_row, d_col) + (SQRT2 - 1) * min(d_row, d_col)
+
+
+def euclidean(row1:int, col1:int, row2:int, col2:int) -> float:
+    """Admissible on "square4" and "square8" grids, looser than their default heuristics
+    """
+    return math.hypot(row1 - row2, col1 - col2)
+
+
+def hexDistance(row1:int, col1:int, row2:int, col2:int) -> int:
+    """Admissible for "hex" grids, whose odd columns are shifted half a cell down
+
+    The offset coordinates are converted to cube coordinates, where the distance
+    is the largest difference among the three axes.
+
+    Reference = [https://www.redblobgames.com/grids/hexagons/#distances]
+    """
+    z1 = row1 - (col1 - (col1 & 1)) // 2
+    z2 = row2 - (col2 - (col2 & 1)) // 2
+    d_x, d_z = col1 - col2, z1 - z2
+    return max(abs(d_x), abs(d_z), abs(d_x + d_z))
+
+
+heuristics = {
+    "manhattan": manhattan,
+    "octile": octile,
+    "euclidean": euclidean,
+    "hex": hexDistance,
+}
+
+# The tightest admissible heuristic of each grid topology
+default_heuristics = {
+    "square4": manhattan,
+    "square8": octile,
+    "hex": hexDistance,
+}
+
+
+def getHeuristic(heuristic, topology:str):
+    """Resolves the heuristic to be used in a search
+
+    Parameters
+    ----------
+    heuristic : str, callable or None
+        A name of "heuristics", a function with the same signature or None for the topology default
+    topology : str
+        The topology of the grid to be searched
+
+    Returns
+    -------
+    callable
+        The heuristic function
+    """
+    if heuristic is None:
+        return default_heuristics[topology]
+    if callable(heuristic):
+        return heuristic
+    if heuristic not in heuristics:
+        raise AttributeError(
+            f'The heuristic "{heuristic}" has not been defined in "heuristics".\n' +
+            f'Heuristics currently defined: {heuristics.keys()}'
+        )
+    return heuristics[heuristic]
@@ -0,0 +1,469 @@
+from collections import deque
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid
+from .heuristics import getHeuristic
+from .result import SearchResult, buildPath
+
+
+class HierarchicalPlanner(object):
+    # Entrances at least this wide get a transition at each end instead of a single one in the middle
+    wide_entrance = 6
+
+    def __init__(self, grid:Grid, cluster_size:int = 16, heuristic=None) -> None:
+        """Hierarchical Path-Finding A* (HPA*) over a grid that is queried many times
+
+        The grid is split in square clusters. Along every border between two clusters,
+        each run of open cell pairs (an entrance) gets one or two transitions, a diagonal
+        (or hexagon side) move across the corner of four clusters gets one too, and the
+        distances between the transitions of a cluster are computed once, the first time
+        a query needs them. A query searches this small abstract graph and then refines
+        each abstract step with a search restricted to a single cluster. Paths are
+        near-optimal, not always the shortest. Transitions are placed without looking at
+        the terrain costs, so paths over costly terrain can be further from the cheapest.
+
+        The planner listens to the wall and cost changes of the grid and, on the next query,
+        only recomputes the borders of the touched clusters and drops their cached distances.
+
+        Reference = [https://webdocs.cs.ualberta.ca/~mmueller/ps/hpastar.pdf]
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid to be searched
+        cluster_size : int, optional
+            The side length of the clusters, by default 16
+        heuristic : str or callable, optional
+            A name of "heuristics.heuristics" or a function (row1, col1, row2, col2) -> cost,
+            by default the admissible heuristic of the grid topology
+        """
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.h = getHeuristic(heuristic, grid.topology)
+        self.cluster_rows = -(-grid.rows // cluster_size)
+        self.cluster_cols = -(-grid.cols // cluster_size)
+
+        self.transitions = {} # (cluster, right, bottom or diagonal bottom cluster) -> [(cell, cell across the border)]
+        self.links = {} # cell -> {cell across a border, one step away: step cost}
+        self.intra = {} # cluster -> {transition cell: {transition cell: distance inside the cluster}}, filled on demand
+        self.dirty = set(range(self.cluster_rows * self.cluster_cols))
+        self.update()
+        grid.addWallListener(self.onWallChanged)
+
+    def close(self) -> None:
+        """Stops listening to the wall changes of the grid
+        """
+        self.grid.removeWallListener(self.onWallChanged)
+
+    def clusterOf(self, idx:int) -> int:
+        """Gets the cluster containing a cell
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+
+        Returns
+        -------
+        int
+            The cluster index
+        """
+        row, col = divmod(idx, self.grid.cols)
+        return ((row // self.cluster_size) * self.cluster_cols) + (col // self.cluster_size)
+
+    def bounds(self, cluster:int) -> tuple:
+        """Gets the cells covered by a cluster
+
+        Parameters
+        ----------
+        cluster : int
+            The cluster index
+
+        Returns
+        -------
+        tuple
+            The first row, the row past the end, the first column and the column past the end
+        """
+        c_row, c_col = divmod(cluster, self.cluster_cols)
+        row0, col0 = c_row * self.cluster_size, c_col * self.cluster_size
+        return row0, min(row0 + self.cluster_size, self.grid.rows), col0, min(col0 + self.cluster_size, self.grid.cols)
+
+    def adjacentClusters(self, cluster:int) -> list:
+        """Gets the clusters sharing a border with a cluster
+
+        Parameters
+        ----------
+        cluster : int
+            The cluster index
+
+        Returns
+        -------
+        list
+            The indices of the left, right, upper and lower clusters that exist
+        """
+        c_row, c_col = divmod(cluster, self.cluster_cols)
+        cond_idx = [
+            (0 < c_col, cluster-1), (c_col < self.cluster_cols-1, cluster+1),
+            (0 < c_row, cluster-self.cluster_cols), (c_row < self.cluster_rows-1, cluster+self.cluster_cols)
+        ]
+        return [i for condition, i in cond_idx if condition]
+
+    def diagonalClusters(self, cluster:int) -> list:
+        """Gets the clusters only sharing a corner with a cluster
+
+        Parameters
+        ----------
+        cluster : int
+            The cluster index
+
+        Returns
+        -------
+        list
+            The indices of the upper left, upper right, lower left and lower right clusters that exist
+        """
+        c_row, c_col = divmod(cluster, self.cluster_cols)
+        return [
+            ((c_row + d_row) * self.cluster_cols) + c_col + d_col
+            for d_row in (-1, 1) for d_col in (-1, 1)
+            if 0 <= c_row + d_row < self.cluster_rows and 0 <= c_col + d_col < self.cluster_cols
+        ]
+
+    def onWallChanged(self, idx:int) -> None:
+        """Marks the cluster of a changed cell to be recomputed, or all of them for None
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+        """
+        if idx is None:
+            self.dirty.update(range(self.cluster_rows * self.cluster_cols))
+        else:
+            self.dirty.add(self.clusterOf(idx))
+
+    def update(self) -> None:
+        """Recomputes the borders of the clusters touched by wall changes and drops their cached distances
+        """
+        if not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, set()
+
+        borders = set()
+        for a in dirty:
+            borders.update((min(a, b), max(a, b)) for b in self.adjacentClusters(a) + self.diagonalClusters(a))
+            # The cells beside a move across a corner lie in the two other clusters around it,
+            # so the corner rule makes that move depend on the walls of this cluster too
+            for diagonal in self.diagonalClusters(a):
+                a_row, a_col = divmod(a, self.cluster_cols)
+                d_row, d_col = divmod(diagonal, self.cluster_cols)
+                beside = ((a_row * self.cluster_cols) + d_col, (d_row * self.cluster_cols) + a_col)
+                borders.add((min(beside), max(beside)))
+        for border in borders:
+            self.buildBorder(*border)
+
+        # The transitions of the surrounding clusters may have moved along the rebuilt borders
+        affected = set(dirty)
+        for cluster in dirty:
+            affected.update(self.adjacentClusters(cluster) + self.diagonalClusters(cluster))
+        for cluster in affected:
+            self.intra.pop(cluster, None)
+
+    def buildBorder(self, first:int, second:int) -> None:
+        """Places the transitions along the border between two adjacent clusters, or across
+        the corner between two diagonal clusters
+
+        Parameters
+        ----------
+        first : int
+            The left or upper cluster
+        second : int
+            The right or lower cluster
+        """
+        grid = self.grid
+        cols = grid.cols
+        for a, b in self.transitions.pop((first, second), []):
+            self.links[a].pop(b, None)
+            self.links[b].pop(a, None)
+
+        row0, row1, col0, col1 = self.bounds(first)
+        first_row, first_col = divmod(first, self.cluster_cols)
+        second_row, second_col = divmod(second, self.cluster_cols)
+        if first_row != second_row and first_col != second_col:
+            # Only the cells at the corner can cross it, through a diagonal (or a hexagon side) move
+            rightward = second_col > first_col
+            a = ((row1 - 1) * cols) + (col1 - 1 if rightward else col0)
+            b = (row1 * cols) + (col1 if rightward else col0 - 1)
+            transitions = [(a, b)] if not grid.isWall(a) and b in grid.neighbors(a) else []
+        else:
+            transitions = self.borderTransitions(first, second)
+
+        self.transitions[(first, second)] = transitions
+        for a, b in transitions:
+            self.links.setdefault(a, {})[b] = grid.moveCost(a, b)
+            self.links.setdefault(b, {})[a] = grid.moveCost(b, a)
+
+    def borderTransitions(self, first:int, second:int) -> list:
+        """Places the transitions along the border between two adjacent clusters
+
+        Parameters
+        ----------
+        first : int
+            The left or upper cluster
+        second : int
+            The right or lower cluster
+
+        Returns
+        -------
+        list
+            The (cell, cell across the border) of every transition
+        """
+        grid = self.grid
+        cols = grid.cols
+        row0, row1, col0, col1 = self.bounds(first)
+        if second == first + self.cluster_cols:
+            pairs = [(((row1 - 1) * cols) + col, (row1 * cols) + col) for col in range(col0, col1)]
+        else:
+            pairs = [((row * cols) + col1 - 1, (row * cols) + col1) for row in range(row0, row1)]
+
+        # Splitting the border in entrances: maximal runs of pairs with both cells open
+        transitions = []
+        entrance = []
+        for pair in pairs + [None]:
+            if pair and not grid.isWall(pair[0]) and not grid.isWall(pair[1]):
+                entrance.append(pair)
+                continue
+            if len(entrance) >= self.wide_entrance:
+                transitions += [entrance[0], entrance[-1]]
+            elif entrance:
+                transitions.append(entrance[len(entrance) // 2])
+            entrance = []
+
+        # Cells crossing only through a diagonal (or a hexagon side) get a transition of their own,
+        # the others reach the crossing through the entrance along the border
+        straight = {cell for a, b in pairs if not grid.isWall(a) and not grid.isWall(b) for cell in (a, b)}
+        for a, _ in pairs:
+            if grid.isWall(a) or a in straight:
+                continue
+            for b in grid.neighbors(a):
+                if b not in straight and self.clusterOf(b) == second:
+                    transitions.append((a, b))
+
+        return transitions
+
+    def entrances(self, cluster:int) -> set:
+        """Gets the transition cells inside a cluster
+
+        Parameters
+        ----------
+        cluster : int
+            The cluster index
+
+        Returns
+        -------
+        set
+            The indices of the transition cells
+        """
+        cells = set()
+        for other in self.adjacentClusters(cluster) + self.diagonalClusters(cluster):
+            border = (min(cluster, other), max(cluster, other))
+            for pair in self.transitions.get(border, []):
+                cells.add(pair[0] if cluster == border[0] else pair[1])
+        return cells
+
+    def intraEdges(self, cell:int) -> dict:
+        """Gets the distances from a transition cell to the other transitions of its cluster
+
+        They are computed on their first use and kept until a wall change touches the cluster.
+
+        Parameters
+        ----------
+        cell : int
+            The transition cell index
+
+        Returns
+        -------
+        dict
+            Maps the reachable transition cells of the cluster to their distance
+        """
+        cluster = self.clusterOf(cell)
+        edges = self.intra.setdefault(cluster, {})
+        if cell not in edges:
+            entrances = self.entrances(cluster)
+            g_score, _ = self.searchCluster(cluster, cell, entrances)
+            edges[cell] = {other: g_score[other] for other in entrances if other in g_score and other != cell}
+        return edges[cell]
+
+    def searchCluster(self, cluster:int, source:int, targets:set, reverse:bool = False) -> tuple:
+        """Runs Dijkstra's algorithm (a breadth-first search on unit-cost grids) from a cell without leaving its cluster
+
+        The distances include the costs of the cells entered (see "Grid.setCost").
+
+        Parameters
+        ----------
+        cluster : int
+            The cluster index
+        source : int
+            The starting cell index
+        targets : set
+            The search stops once all of these cells are reached
+        reverse : bool, optional
+            Whether to measure the distances from the reached cells to the starting one,
+            every step costing the cell left instead of the cell entered, by default False
+
+        Returns
+        -------
+        tuple
+            The distances and the "came_from" mapping of the reached cells
+        """
+        grid = self.grid
+        cols = grid.cols
+        row0, row1, col0, col1 = self.bounds(cluster)
+        diagonal = grid.topology == "square8"
+        costs = grid.costs
+
+        g_score = {source: 0}
+        came_from = {}
+        remaining = len(targets - {source})
+
+        if not diagonal and costs is None:
+            # With unit costs, a breadth-first search gives every cell its final distance as soon as it is reached
+            open_set = deque([source])
+            while open_set and remaining:
+                current = open_set.popleft()
+                next_g = g_score[current] + 1
+                for neighbor in grid.neighbors(current):
+                    if neighbor in g_score:
+                        continue
+                    row, col = divmod(neighbor, cols)
+                    if not (row0 <= row < row1 and col0 <= col < col1):
+                        continue
+                    g_score[neighbor] = next_g
+                    came_from[neighbor] = current
+                    open_set.append(neighbor)
+                    if neighbor in targets:
+                        remaining -= 1
+            return g_score, came_from
+
+        closed = set()
+        open_set = [(0, source)]
+        while open_set and remaining:
+            current_g, current = heappop(open_set)
+            if current in closed:
+                continue
+            closed.add(current)
+            if current in targets and current != source:
+                remaining -= 1
+
+            for neighbor, step in grid.steps(current):
+                row, col = divmod(neighbor, cols)
+                if not (row0 <= row < row1 and col0 <= col < col1):
+                    continue
+                if costs is not None:
+                    step *= costs[current if reverse else neighbor]
+                if current_g + step < g_score.get(neighbor, float("inf")):
+                    g_score[neighbor] = current_g + step
+                    came_from[neighbor] = current
+                    heappush(open_set, (current_g + step, neighbor))
+
+        # Only the settled distances are final
+        return {cell: g for cell, g in g_score.items() if cell in closed or cell == source}, came_from
+
+    def query(self, start:int, end:int, observer=None) -> SearchResult:
+        """Searches a path through the abstract graph and refines it into cells
+
+        Parameters
+        ----------
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        observer : callable, optional
+            Receives (cell, state) every time a cell changes its state, by default None
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics, "expanded" counts the abstract nodes
+        """
+        t0 = perf_counter()
+        self.update()
+        start_cluster, end_cluster = self.clusterOf(start), self.clusterOf(end)
+
+        if start_cluster == end_cluster:
+            g_score, came_from = self.searchCluster(start_cluster, start, {end})
+            if end in g_score:
+                return SearchResult(buildPath(came_from, end, observer), 1, perf_counter() - t0)
+
+        # Temporarily connecting the starting and ending points to the transitions of their clusters
+        start_entrances, end_entrances = self.entrances(start_cluster), self.entrances(end_cluster)
+        start_edges, _ = self.searchCluster(start_cluster, start, start_entrances)
+        start_edges = {cell: g for cell, g in start_edges.items() if cell in start_entrances}
+        end_edges, _ = self.searchCluster(end_cluster, end, end_entrances, reverse=True)
+        end_edges = {cell: g for cell, g in end_edges.items() if cell in end_entrances}
+
+        cols = self.grid.cols
+        end_row, end_col = divmod(end, cols)
+        expanded = 0
+        came_from = {}
+        g_score = {start: 0}
+        closed = set()
+        open_set = [(self.h(*divmod(start, cols), end_row, end_col), 0, start)]
+
+        while open_set:
+            _, neg_g, current = heappop(open_set)
+            if current in closed:
+                continue
+            closed.add(current)
+            expanded += 1
+
+            if current == end:
+                path = self.refine(buildPath(came_from, end))
+                if observer:
+                    for cell in path:
+                        observer(cell, "path")
+                return SearchResult(path, expanded, perf_counter() - t0)
+
+            if current == start:
+                edges = list(start_edges.items())
+            else:
+                edges = list(self.intraEdges(current).items())
+            edges += list(self.links.get(current, {}).items())
+            if current in end_edges:
+                edges.append((end, end_edges[current]))
+
+            for neighbor, cost in edges:
+                temp_g_score = -neg_g + cost
+                if neighbor not in closed and temp_g_score < g_score.get(neighbor, float("inf")):
+                    if observer and neighbor not in g_score:
+                        observer(neighbor, "watch")
+                    came_from[neighbor] = current
+                    g_score[neighbor] = temp_g_score
+                    row, col = divmod(neighbor, cols)
+                    heappush(open_set, (temp_g_score + self.h(row, col, end_row, end_col), -temp_g_score, neighbor))
+
+            if current != start and observer:
+                observer(current, "visited")
+
+        return SearchResult([], expanded, perf_counter() - t0)
+
+    def refine(self, abstract_path:list) -> list:
+        """Turns a path of transition cells into a path of adjacent cells
+
+        Parameters
+        ----------
+        abstract_path : list
+            The cells of the abstract path, from the starting to the ending point
+
+        Returns
+        -------
+        list
+            The cell indices from the starting point to the ending point
+        """
+        path = abstract_path[:1]
+        for current, following in zip(abstract_path, abstract_path[1:]):
+            if following in self.links.get(current, {}):
+                path.append(following)
+                continue
+            _, came_from = self.searchCluster(self.clusterOf(current), current, {following})
+            path += buildPath(came_from, following)[1:]
+        return path
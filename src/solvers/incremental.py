@@ -0,0 +1,222 @@
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid
+from .heuristics import getHeuristic
+from .result import SearchResult
+
+
+class IncrementalPlanner(object):
+    def __init__(self, grid:Grid, heuristic=None) -> None:
+        """Lifelong Planning A* (LPA*), a search that keeps its state between queries
+
+        Every cell holds g, its distance as of the last search, and rhs, a one-step
+        lookahead computed from the g of its neighbors. Cells where both differ are
+        "inconsistent" and wait in the open set. When walls change, only the changed
+        cells and their neighbors are updated, so the next query repairs the part of
+        the previous search affected by the edit instead of starting over. Cost changes
+        (see "Grid.setCost") are repaired the same way.
+
+        The search state is discarded when the starting or ending point changes.
+
+        Reference = [http://idm-lab.org/bib/abstracts/papers/aij04.pdf]
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid to be searched
+        heuristic : str or callable, optional
+            A name of "heuristics.heuristics" or a function (row1, col1, row2, col2) -> cost,
+            by default the admissible heuristic of the grid topology
+        """
+        self.grid = grid
+        self.h = getHeuristic(heuristic, grid.topology)
+        self.start = None
+        self.end = None
+        self.changed = set() # Cells whose wall state changed since the last query
+        grid.addWallListener(self.onWallChanged)
+
+    def close(self) -> None:
+        """Stops listening to the wall changes of the grid
+        """
+        self.grid.removeWallListener(self.onWallChanged)
+
+    def onWallChanged(self, idx:int) -> None:
+        """Records a changed cell to be updated on the next query, or discards the state for None
+
+        Parameters
+        ----------
+        idx : int
+            The cell index
+        """
+        if idx is None:
+            self.start = self.end = None
+        else:
+            self.changed.add(idx)
+
+    def reset(self, start:int, end:int) -> None:
+        """Discards the search state and starts a new one between two cells
+
+        Parameters
+        ----------
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        """
+        self.start, self.end = start, end
+        self.end_row, self.end_col = divmod(end, self.grid.cols)
+        self.g_score = {}
+        self.rhs = {start: 0}
+        self.open_set = []
+        self.queued = {} # Cell -> key of its valid entry in the open set
+        self.changed = set()
+        self.push(start)
+
+    def cost(self, a:int, b:int) -> float:
+        """Gets the cost of the step between two adjacent cells
+
+        Parameters
+        ----------
+        a : int
+            The first cell index
+        b : int
+            The second cell index
+
+        Returns
+        -------
+        float
+            The cost of entering the second cell, times sqrt(2) for diagonal steps
+        """
+        return self.grid.moveCost(a, b)
+
+    def key(self, cell:int) -> tuple:
+        """Gets the priority of an inconsistent cell in the open set
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+
+        Returns
+        -------
+        tuple
+            min(g, rhs) + h and min(g, rhs)
+        """
+        inf = float("inf")
+        best = min(self.g_score.get(cell, inf), self.rhs.get(cell, inf))
+        row, col = divmod(cell, self.grid.cols)
+        return (best + self.h(row, col, self.end_row, self.end_col), best)
+
+    def push(self, cell:int) -> None:
+        """Inserts a cell in the open set, replacing its previous entry
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+        """
+        key = self.key(cell)
+        self.queued[cell] = key
+        heappush(self.open_set, (key, cell))
+
+    def topKey(self) -> tuple:
+        """Gets the lowest key of the open set, dropping the outdated entries on top
+
+        Returns
+        -------
+        tuple
+            The lowest key, (inf, inf) when the open set is empty
+        """
+        open_set = self.open_set
+        while open_set and self.queued.get(open_set[0][1]) != open_set[0][0]:
+            heappop(open_set)
+        return open_set[0][0] if open_set else (float("inf"), float("inf"))
+
+    def updateCell(self, cell:int) -> None:
+        """Recomputes the rhs of a cell and (re)queues it if it became inconsistent
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+        """
+        inf = float("inf")
+        if cell != self.start:
+            if self.grid.isWall(cell):
+                rhs = inf
+            else:
+                g_score = self.g_score
+                rhs = min((g_score.get(n, inf) + self.cost(n, cell) for n in self.grid.neighbors(cell)), default=inf)
+            if rhs == inf:
+                self.rhs.pop(cell, None)
+            else:
+                self.rhs[cell] = rhs
+
+        self.queued.pop(cell, None)
+        if self.g_score.get(cell, inf) != self.rhs.get(cell, inf):
+            self.push(cell)
+
+    def query(self, start:int, end:int, observer=None) -> SearchResult:
+        """Searches the shortest path, reusing the previous search when the points did not change
+
+        Parameters
+        ----------
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        observer : callable, optional
+            Receives (cell, state) every time a cell changes its state, by default None
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics, "expanded" only counts this query
+        """
+        t0 = perf_counter()
+        inf = float("inf")
+        if (start, end) != (self.start, self.end):
+            self.reset(start, end)
+
+        for cell in self.changed:
+            self.updateCell(cell)
+            for neighbor in self.grid.neighbors(cell):
+                self.updateCell(neighbor)
+        self.changed = set()
+
+        g_score, rhs = self.g_score, self.rhs
+        expanded = 0
+        while self.topKey() < self.key(end) or g_score.get(end, inf) != rhs.get(end, inf):
+            if not self.open_set:
+                break
+            _, current = heappop(self.open_set)
+            del self.queued[current]
+            expanded += 1
+
+            if g_score.get(current, inf) > rhs.get(current, inf):
+                # Overconsistent: its distance got shorter, it is settled and propagated
+                g_score[current] = rhs[current]
+                if current != start and observer:
+                    observer(current, "visited")
+            else:
+                # Underconsistent: its distance got longer (or unreachable), it is raised and requeued
+                g_score.pop(current, None)
+                self.updateCell(current)
+            for neighbor in self.grid.neighbors(current):
+                if observer and neighbor not in self.queued and neighbor not in g_score:
+                    observer(neighbor, "watch")
+                self.updateCell(neighbor)
+
+        if g_score.get(end, inf) == inf:
+            return SearchResult([], expanded, perf_counter() - t0)
+
+        # Walking back from the end through the neighbors that give the shortest distances
+        path = [end]
+        current = end
+        while current != start:
+            current = min(self.grid.neighbors(current), key=lambda n: g_score.get(n, inf) + self.cost(n, current))
+            path.append(current)
+            if observer:
+                observer(current, "path")
+        path.reverse()
+        return SearchResult(path, expanded, perf_counter() - t0)
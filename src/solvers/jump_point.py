@@ -0,0 +1,215 @@
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid, WALL
+from .heuristics import SQRT2, manhattan, octile
+from .result import SearchResult
+
+
+def jumpPointSearch(grid:Grid, start:int, end:int, observer=None) -> SearchResult:
+    """Runs Jump Point Search algorithm
+
+    An A* variant for uniform-cost square grids. Instead of pushing every neighbor,
+    it jumps straight (and diagonally on "square8" grids) over the cells that
+    some other path reaches just as cheaply, only stopping at "jump points":
+    cells with a forced neighbor, i.e. a neighbor made reachable only by an
+    adjacent wall. On open maps it expands a small fraction of the nodes of A*
+    while returning paths of the same length.
+
+    On "square4" grids, horizontal moves are only allowed to turn at forced
+    neighbors and every vertical step scans both horizontal directions.
+
+    Reference = [https://harabor.net/data/papers/harabor-grastien-aaai11.pdf]
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid to be searched, with "square4" or "square8" topology, the diagonal moves
+        being allowed beside walls (the "cut" corner rule) and without terrain costs
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    observer : callable, optional
+        Receives (cell, state) every time a cell changes its state, by default None
+
+    Returns
+    -------
+    SearchResult
+        The path found and the search statistics
+    """
+    if grid.topology not in ("square4", "square8"):
+        raise AttributeError(f'Jump Point Search does not support the "{grid.topology}" topology')
+    if grid.topology == "square8" and grid.corner_rule != "cut":
+        raise AttributeError(f'Jump Point Search does not support the "{grid.corner_rule}" corner rule')
+    if grid.costs is not None:
+        raise AttributeError('Jump Point Search does not support terrain costs, see "Grid.clearCosts"')
+
+    rows, cols, cells = grid.rows, grid.cols, grid.cells
+    end_row, end_col = divmod(end, cols)
+    diagonal = grid.topology == "square8"
+    h = octile if diagonal else manhattan
+
+    def isOpen(row:int, col:int) -> bool:
+        return 0 <= row < rows and 0 <= col < cols and cells[(row * cols) + col] != WALL
+
+    def jumpStraight(row:int, col:int, d_row:int, d_col:int):
+        # Moves horizontally or vertically until a wall, the end or a cell with a forced neighbor
+        while True:
+            row += d_row
+            col += d_col
+            if not isOpen(row, col):
+                return None
+            if row == end_row and col == end_col:
+                return row, col
+            if d_col:
+                if diagonal:
+                    if (not isOpen(row-1, col) and isOpen(row-1, col+d_col)) or \
+                       (not isOpen(row+1, col) and isOpen(row+1, col+d_col)):
+                        return row, col
+                elif (isOpen(row-1, col) and not isOpen(row-1, col-d_col)) or \
+                     (isOpen(row+1, col) and not isOpen(row+1, col-d_col)):
+                    return row, col
+            elif diagonal:
+                if (not isOpen(row, col-1) and isOpen(row+d_row, col-1)) or \
+                   (not isOpen(row, col+1) and isOpen(row+d_row, col+1)):
+                    return row, col
+            elif jumpStraight(row, col, 0, 1) or jumpStraight(row, col, 0, -1):
+                # On "square4" grids the vertical moves branch horizontally at every step
+                return row, col
+
+    def jumpDiagonal(row:int, col:int, d_row:int, d_col:int):
+        # Moves diagonally until a wall, the end, a forced neighbor or a straight jump point
+        while True:
+            row += d_row
+            col += d_col
+            if not isOpen(row, col):
+                return None
+            if row == end_row and col == end_col:
+                return row, col
+            if (not isOpen(row-d_row, col) and isOpen(row-d_row, col+d_col)) or \
+               (not isOpen(row, col-d_col) and isOpen(row+d_row, col-d_col)):
+                return row, col
+            if jumpStraight(row, col, d_row, 0) or jumpStraight(row, col, 0, d_col):
+                return row, col
+
+    def directions(row:int, col:int, parent:int) -> list:
+        # Prunes the neighbors that are reached at least as cheaply without passing by the cell
+        if parent is None:
+            straight = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+            return straight + [(-1, -1), (-1, 1), (1, -1), (1, 1)] if diagonal else straight
+
+        p_row, p_col = divmod(parent, cols)
+        d_row = (row > p_row) - (row < p_row)
+        d_col = (col > p_col) - (col < p_col)
+
+        if d_row and d_col:
+            dirs = [(d_row, 0), (0, d_col), (d_row, d_col)]
+            if not isOpen(row-d_row, col):
+                dirs.append((-d_row, d_col))
+            if not isOpen(row, col-d_col):
+                dirs.append((d_row, -d_col))
+        elif not diagonal:
+            if d_row:
+                dirs = [(d_row, 0), (0, 1), (0, -1)]
+            else:
+                dirs = [(0, d_col)]
+                if isOpen(row-1, col) and not isOpen(row-1, col-d_col):
+                    dirs.append((-1, 0))
+                if isOpen(row+1, col) and not isOpen(row+1, col-d_col):
+                    dirs.append((1, 0))
+        elif d_col:
+            dirs = [(0, d_col)]
+            if not isOpen(row-1, col):
+                dirs.append((-1, d_col))
+            if not isOpen(row+1, col):
+                dirs.append((1, d_col))
+        else:
+            dirs = [(d_row, 0)]
+            if not isOpen(row, col-1):
+                dirs.append((d_row, -1))
+            if not isOpen(row, col+1):
+                dirs.append((d_row, 1))
+        return dirs
+
+    t0 = perf_counter()
+    if grid.components is not None and not grid.components.connected(start, end):
+        return SearchResult([], 0, perf_counter() - t0) # The points are in different regions
+    expanded = 0
+    came_from = {}
+    g_score = {start: 0}
+    closed = set()
+    open_set = [(h(*divmod(start, cols), end_row, end_col), 0, start)]
+
+    while open_set:
+        _, neg_g, current = heappop(open_set)
+        if current in closed:
+            continue # Outdated entry, the cell was reached again through a shorter path
+        closed.add(current)
+        expanded += 1
+
+        if current == end:
+            path = buildJumpPath(came_from, end, cols, observer)
+            return SearchResult(path, expanded, perf_counter() - t0)
+
+        row, col = divmod(current, cols)
+        for d_row, d_col in directions(row, col, came_from.get(current)):
+            if d_row and d_col:
+                jump_point = jumpDiagonal(row, col, d_row, d_col)
+            else:
+                jump_point = jumpStraight(row, col, d_row, d_col)
+            if not jump_point:
+                continue
+
+            j_row, j_col = jump_point
+            neighbor = (j_row * cols) + j_col
+            if neighbor in closed:
+                continue
+            d_rows, d_cols = abs(j_row - row), abs(j_col - col)
+            temp_g_score = -neg_g + max(d_rows, d_cols) + (SQRT2 - 1) * min(d_rows, d_cols)
+
+            if temp_g_score < g_score.get(neighbor, float("inf")):
+                if observer and neighbor not in g_score:
+                    observer(neighbor, "watch")
+                came_from[neighbor] = current
+                g_score[neighbor] = temp_g_score
+                heappush(open_set, (temp_g_score + h(j_row, j_col, end_row, end_col), -temp_g_score, neighbor))
+
+        if current != start and observer:
+            observer(current, "visited")
+
+    return SearchResult([], expanded, perf_counter() - t0)
+
+
+def buildJumpPath(came_from:dict, end:int, cols:int, observer=None) -> list:
+    """Rebuilds the path walking back through the jump points and every cell between them
+
+    Parameters
+    ----------
+    came_from : dict
+        Maps each jump point to the jump point it was reached from
+    end : int
+        The ending point
+    cols : int
+        Amount of horizontal cells
+    observer : callable, optional
+        Receives (cell, "path") for each cell in the way back, by default None
+
+    Returns
+    -------
+    list
+        The cell indices from the starting point to the ending point
+    """
+    path = [end]
+    current = end
+    while current in came_from:
+        parent = came_from[current]
+        row, col = divmod(current, cols)
+        p_row, p_col = divmod(parent, cols)
+        step = (((p_row > row) - (p_row < row)) * cols) + ((p_col > col) - (p_col < col))
+        while current != parent:
+            current += step
+            path.append(current)
+            if observer:
+                observer(current, "path")
+    path.reverse()
+    return path
@@ -0,0 +1,171 @@
+import json
+import tracemalloc
+from grid import Grid
+from .result import SearchResult, pathCost
+
+
+def searchMetrics(search, grid:Grid, start:int, end:int, result:SearchResult, peak_memory:int = None) -> dict:
+    """Gathers the statistics of a search into a record that can be serialized as JSON
+
+    Parameters
+    ----------
+    search : callable
+        The solver, e.g. "solvers.aStar"
+    grid : Grid
+        The grid searched
+    start : int
+        The starting cell index
+    end : int
+        The ending cell index
+    result : SearchResult
+        The result of the solver
+    peak_memory : int, optional
+        The peak of memory allocated by the search in bytes, by default None when not traced
+
+    Returns
+    -------
+    dict
+        The algorithm name, the grid size and topology, the points, whether the end was
+        reached, the path length and cost, the open set counters of the result, the time
+        in seconds and the peak memory
+    """
+    return {
+        "algorithm": getattr(search, "__name__", str(search)),
+        "rows": grid.rows,
+        "cols": grid.cols,
+        "topology": grid.topology,
+        "start": start,
+        "end": end,
+        "found": result.found,
+        "length": len(result.path),
+        "cost": pathCost(grid, result.path),
+        "expanded": result.expanded,
+        "pushes": result.pushes,
+        "pops": result.pops,
+        "peak_open": result.peak_open,
+        "elapsed": result.elapsed,
+        "peak_memory": peak_memory,
+    }
+
+
+class JsonLinesWriter(object):
+    def __init__(self, path:str) -> None:
+        """A sink appending every record it receives to a file, one JSON object per line
+
+        Parameters
+        ----------
+        path : str
+            The file path, created if it does not exist
+        """
+        self.file = open(path, "a")
+
+    def __call__(self, record:dict) -> None:
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        """Closes the file
+        """
+        self.file.close()
+
+
+class Profiler(object):
+    def __init__(self, sinks:list = None, memory:bool = False) -> None:
+        """Records the statistics of searches and sends them to some sinks
+
+        The solvers always count their expansions, pushes, pops and peak open set size,
+        which only costs a few integer operations per expansion. Everything else (the
+        records, the path cost and the memory tracing) is only done by a profiler, so a
+        search that is not profiled runs at full speed.
+
+        Parameters
+        ----------
+        sinks : list, optional
+            The callables receiving every record (see "searchMetrics"), e.g. a "JsonLinesWriter",
+            by default None for none
+        memory : bool, optional
+            Whether "run" traces the memory allocations of the searches, by default False.
+            Tracing makes the searches several times slower, so their times are not comparable
+        """
+        self.sinks = list(sinks or [])
+        self.memory = memory
+        self.last = None # The most recent record
+
+    def addSink(self, sink) -> None:
+        """Registers a callable receiving every record
+
+        Parameters
+        ----------
+        sink : callable
+            Receives the record dict of every search
+        """
+        self.sinks.append(sink)
+
+    def record(self, search, grid:Grid, start:int, end:int, result:SearchResult, peak_memory:int = None) -> dict:
+        """Records the result of a search that already ran, sending it to the sinks
+
+        Parameters
+        ----------
+        search : callable
+            The solver
+        grid : Grid
+            The grid searched
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        result : SearchResult
+            The result of the solver
+        peak_memory : int, optional
+            The peak of memory allocated by the search in bytes, by default None
+
+        Returns
+        -------
+        dict
+            The record
+        """
+        self.last = searchMetrics(search, grid, start, end, result, peak_memory)
+        for sink in self.sinks:
+            sink(self.last)
+        return self.last
+
+    def run(self, search, grid:Grid, start:int, end:int, **kwargs) -> SearchResult:
+        """Runs a solver and records its result
+
+        Parameters
+        ----------
+        search : callable
+            The solver, e.g. "solvers.aStar"
+        grid : Grid
+            The grid to be searched
+        start : int
+            The starting cell index
+        end : int
+            The ending cell index
+        kwargs
+            The extra arguments given to the solver, e.g. heuristic or observer
+
+        Returns
+        -------
+        SearchResult
+            The path found and the search statistics
+        """
+        if not self.memory:
+            result = search(grid, start, end, **kwargs)
+            self.record(search, grid, start, end, result)
+            return result
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            result = search(grid, start, end, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+        self.record(search, grid, start, end, result, peak)
+        return result
@@ -0,0 +1,400 @@
+from heapq import heappush, heappop
+from time import perf_counter
+from grid import Grid
+from .heuristics import getHeuristic
+from .result import SearchResult
+
+
+class ReverseDistance(object):
+    def __init__(self, grid:Grid, goal:int, origin:int, heuristic=None) -> None:
+        """The exact distance from any cell to a goal, computed on demand (Reverse Resumable A*)
+
+        A backward A* runs from the goal toward an origin cell and is only resumed when
+        the distance of a cell not settled yet is requested. With a consistent heuristic
+        every settled cell has its exact distance, so this is a perfect heuristic for a
+        search from the origin that costs about as much as a plain A* between them.
+        Cells not settled yet also have a lower bound that does not resume it ("estimate").
+
+        Reference = [https://www.davidsilver.uk/wp-content/uploads/2020/03/coop-path-AIWisdom.pdf]
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid
+        goal : int
+            The cell the distances are measured to
+        origin : int
+            The cell the backward search heads to
+        heuristic : str or callable, optional
+            A name of "heuristics.heuristics" or a function (row1, col1, row2, col2) -> cost,
+            by default the admissible heuristic of the grid topology
+        """
+        self.grid = grid
+        self.h = getHeuristic(heuristic, grid.topology)
+        self.origin_row, self.origin_col = divmod(origin, grid.cols)
+        self.goal_row, self.goal_col = divmod(goal, grid.cols)
+        self.g_score = {goal: 0}
+        self.closed = set()
+        # Entries are (f, -g, cell): lowest f first, then highest g
+        self.open_set = [(self.h(self.goal_row, self.goal_col, self.origin_row, self.origin_col), 0, goal)]
+
+    def estimate(self, cell:int) -> float:
+        """Gets a lower bound of the distance from a cell to the goal, without resuming the search
+
+        Every cell not settled yet has a distance plus heuristic to the origin of at least the
+        lowest f of the open set, as the heuristic is consistent.
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+
+        Returns
+        -------
+        float
+            The exact distance of settled cells, else a lower bound, inf if the goal is not reachable
+        """
+        if cell in self.closed:
+            return self.g_score[cell]
+        if not self.open_set:
+            return float("inf")
+        row, col = divmod(cell, self.grid.cols)
+        return max(
+            self.h(row, col, self.goal_row, self.goal_col),
+            self.open_set[0][0] - self.h(row, col, self.origin_row, self.origin_col)
+        )
+
+    def distance(self, cell:int) -> float:
+        """Gets the cost of the cheapest path from a cell to the goal
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+
+        Returns
+        -------
+        float
+            The distance, inf if the goal is not reachable
+        """
+        if cell in self.closed:
+            return self.g_score[cell]
+
+        steps, costs, cols = self.grid.steps, self.grid.costs, self.grid.cols
+        h, origin_row, origin_col = self.h, self.origin_row, self.origin_col
+        g_score, closed, open_set = self.g_score, self.closed, self.open_set
+        inf = float("inf")
+        while open_set:
+            _, neg_g, current = heappop(open_set)
+            current_g = -neg_g
+            if current in closed or current_g > g_score[current]:
+                continue # Outdated entry
+            closed.add(current)
+
+            # Going backward, the step from the neighbor enters the current cell
+            entry = 1 if costs is None else costs[current]
+            for neighbor, step in steps(current):
+                temp_g_score = current_g + (step * entry)
+                if temp_g_score < g_score.get(neighbor, inf):
+                    g_score[neighbor] = temp_g_score
+                    row, col = divmod(neighbor, cols)
+                    heappush(open_set, (temp_g_score + h(row, col, origin_row, origin_col), -temp_g_score, neighbor))
+
+            if current == cell:
+                return current_g
+        return inf
+
+
+class ReservationTable(object):
+    def __init__(self, size:int) -> None:
+        """The cells and moves taken by the agents already planned, at every time step
+
+        Time steps and cells are packed into integers, (time * size) + cell, so the lookups
+        are set membership tests on plain integers.
+
+        Parameters
+        ----------
+        size : int
+            Amount of cells of the grid
+        """
+        self.size = size
+        self.cells = set() # (time * size) + cell, for every occupied cell
+        self.moves = set() # (((time * size) + a) * size) + b, for every move from a to b between time and time + 1
+        self.parked = {} # Cell -> time from which an agent stays there for good
+        self.latest = {} # Cell -> last time step it is occupied, parked agents aside
+
+    def reserve(self, path:list) -> None:
+        """Reserves the cells and moves of a timed path, its agent staying at its last cell afterwards
+
+        Parameters
+        ----------
+        path : list
+            The cell of the agent at every time step
+        """
+        size, latest = self.size, self.latest
+        for time, cell in enumerate(path):
+            self.cells.add((time * size) + cell)
+            if latest.get(cell, -1) < time:
+                latest[cell] = time
+            if time and path[time - 1] != cell:
+                self.moves.add((((time - 1) * size) + path[time - 1]) * size + cell)
+        self.parked[path[-1]] = len(path) - 1
+
+    def isFree(self, cell:int, time:int) -> bool:
+        """Indicates whether a cell is free at a time step
+
+        Parameters
+        ----------
+        cell : int
+            The cell index
+        time : int
+            The time step
+
+        Returns
+        -------
+        bool
+            True, if no agent is there
+        """
+        return (time * self.size) + cell not in self.cells and self.parked.get(cell, time + 1) > time
+
+    def isSwap(self, a:int, b:int, time:int) -> bool:
+        """Indicates whether moving from a cell to another one crosses an agent doing the opposite move
+
+        Parameters
+        ----------
+        a : int
+            The cell left at the time step
+        b : int
+            The cell entered at the next time step
+        time : int
+            The time step
+
+        Returns
+        -------
+        bool
+            True, if an agent moves from b to a at the same time
+        """
+        return (((time * self.size) + b) * self.size) + a in self.moves
+
+
+class CooperativePlanner(object):
+    def __init__(self, grid:Grid, max_delay:int = None) -> None:
+        """Plans collision-free paths for many agents sharing a grid (Cooperative A*)
+
+        The agents are planned one after the other by a space-time A*: every state is a
+        cell at a time step, moving to an adjacent cell or waiting in place takes one time
+        step, and the states taken by the agents already planned are looked up in a
+        "ReservationTable". Once at its goal, an agent stays there.
+
+        The heuristic of every agent is its distance to the goal, computed by a backward
+        search from it ("ReverseDistance") that is kept for the following plans while the grid
+        revision does not change. It is exact on the cells settled by the backward search,
+        so an agent that meets no other agent expands about as many states as the length of
+        its path, and a bound elsewhere. Once every agent planned before has reached its goal,
+        each cell is only expanded once, which keeps the waits from multiplying the states.
+
+        Planning in order is fast but not complete: an agent can be boxed in by the ones
+        planned before it, in which case its path is empty and the others ignore it.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid
+        max_delay : int, optional
+            The most time steps an agent may spend waiting or going around other agents, beyond
+            the cost of its shortest path, by default rows + cols
+        """
+        self.grid = grid
+        self.max_delay = grid.rows + grid.cols if max_delay is None else max_delay
+        self.distances = {} # Goal -> its "ReverseDistance"
+        self.revision = grid.revision
+
+    def close(self) -> None:
+        """Drops the distances kept for the following plans
+        """
+        self.distances.clear()
+
+    def distanceTo(self, goal:int, origin:int) -> ReverseDistance:
+        """Gets the exact distances to a goal, dropping every one of them if the grid changed
+
+        Parameters
+        ----------
+        goal : int
+            The goal cell index
+        origin : int
+            The cell the distances are first needed from
+
+        Returns
+        -------
+        ReverseDistance
+            The distances
+        """
+        if self.grid.revision != self.revision:
+            self.distances.clear()
+            self.revision = self.grid.revision
+        distance = self.distances.get(goal)
+        if distance is None:
+            distance = self.distances[goal] = ReverseDistance(self.grid, goal, origin)
+        return distance
+
+    def plan(self, agents:list) -> list:
+        """Plans the paths of some agents, in the order given
+
+        Parameters
+        ----------
+        agents : list
+            The (start, goal) cell indices of every agent, no two agents sharing a start or a goal
+
+        Returns
+        -------
+        list
+            The result of every agent, whose path holds its cell at every time step (waiting
+            repeats a cell), empty if no path was found
+
+        Examples
+        --------
+        Two agents crossing a plus-shaped corridor, the second one waits for the first to pass:
+
+        >>> grid = Grid(5, 5)
+        >>> for idx in range(len(grid)):
+        ...     grid.setWall(idx, 2 not in grid.coords(idx))
+        >>> results = CooperativePlanner(grid).plan([(2, 22), (10, 14)])
+        >>> [result.path for result in results]
+        [[2, 7, 12, 17, 22], [10, 11, 11, 12, 13, 14]]
+        >>> findConflicts([result.path for result in results])
+        []
+        """
+        if len({start for start, _ in agents}) < len(agents) or len({goal for _, goal in agents}) < len(agents):
+            raise AttributeError("Two agents can not share a starting cell or a goal")
+
+        reservations = ReservationTable(len(self.grid))
+        for start, _ in agents:
+            reservations.cells.add(start) # Every agent stands on its start at the time step 0
+        results = []
+        for start, goal in agents:
+            result = self.search(start, goal, reservations)
+            if result:
+                reservations.reserve(result.path)
+            results.append(result)
+        return results
+
+    def search(self, start:int, goal:int, reservations:ReservationTable) -> SearchResult:
+        """Runs a space-time A* for one agent, avoiding the reserved cells and moves
+
+        Parameters
+        ----------
+        start : int
+            The starting cell index
+        goal : int
+            The goal cell index
+        reservations : ReservationTable
+            The cells and moves of the agents already planned
+
+        Returns
+        -------
+        SearchResult
+            The timed path found and the search statistics
+        """
+        grid, costs = self.grid, self.grid.costs
+        size = len(grid)
+        distance = self.distanceTo(goal, start)
+        h, settled = distance.estimate, distance.closed
+        inf = float("inf")
+
+        t0 = perf_counter()
+        expanded = 0
+        if grid.components is not None and not grid.components.connected(start, goal):
+            return SearchResult([], expanded, perf_counter() - t0) # The points are in different regions
+        shortest = distance.distance(start)
+        if shortest == inf:
+            return SearchResult([], expanded, perf_counter() - t0)
+        # Every step costs at least 1, so the shortest path has at most "shortest" steps
+        max_time = int(shortest) + self.max_delay
+        # The goal is only final once no other agent goes through it later. Every step costs at
+        # least 1, so a state needs at least "arrival - time" more steps, also bounding its cost
+        arrival = reservations.latest.get(goal, -1) + 1
+
+        # States are (time * size) + cell. Entries are (f, estimated, -time, cell, g): lowest f first,
+        # then exact distances before estimates, then latest time. The distances of the cells out of
+        # the ones settled by the backward search are estimated instead of resuming it, so the agent
+        # follows the settled cells and only steps out of them to go around other agents
+        # After the last time step reserved only the parked agents are left, so a later state of a
+        # cell can do nothing its first state from then on could not: those cells are expanded once
+        static = max(reservations.latest.values(), default=0) + 1
+        came_from = {}
+        g_score = {start: 0}
+        closed = set()
+        static_cells = set() # The cells expanded at a time step from "static" on
+        open_set = [(max(shortest, arrival), False, 0, start, 0)]
+        while open_set:
+            _, _, neg_time, current, current_g = heappop(open_set)
+            time = -neg_time
+            state = (time * size) + current
+            if state in closed:
+                continue
+            if time >= static:
+                if current in static_cells:
+                    continue
+                static_cells.add(current)
+            closed.add(state)
+            expanded += 1
+
+            if current == goal and time >= arrival:
+                path = [current]
+                while state in came_from:
+                    state = came_from[state]
+                    path.append(state % size)
+                path.reverse()
+                return SearchResult(path, expanded, perf_counter() - t0)
+
+            if time == max_time:
+                continue
+            next_time = time + 1
+            for neighbor, step in grid.steps(current) + [(current, 0)]:
+                next_state = (next_time * size) + neighbor
+                if next_state in closed or not reservations.isFree(neighbor, next_time):
+                    continue
+                if neighbor != current and reservations.isSwap(current, neighbor, time):
+                    continue
+                # Waiting costs 1, like the cheapest move
+                temp_g_score = current_g + (step * (1 if costs is None else costs[neighbor]) or 1)
+                if temp_g_score < g_score.get(next_state, inf):
+                    g_score[next_state] = temp_g_score
+                    came_from[next_state] = state
+                    f = temp_g_score + max(h(neighbor), arrival - next_time)
+                    heappush(open_set, (f, neighbor not in settled, -next_time, neighbor, temp_g_score))
+
+        return SearchResult([], expanded, perf_counter() - t0)
+
+
+def findConflicts(paths:list) -> list:
+    """Seeks for the collisions between some timed paths, the agents staying at their last cell
+
+    Parameters
+    ----------
+    paths : list
+        The cell of every agent at every time step, empty paths being ignored
+
+    Returns
+    -------
+    list
+        The (time, first agent, second agent) of every collision: both agents in the same cell
+        at a time step, or swapping their cells between it and the next one
+    """
+    agents = [(agent, path) for agent, path in enumerate(paths) if path]
+    horizon = max((len(path) for _, path in agents), default=0)
+    conflicts = []
+    for time in range(horizon):
+        occupied = {} # Cell -> agent in it at the time step
+        moves = {} # (cell left, cell entered) -> agent moving
+        for agent, path in agents:
+            cell = path[min(time, len(path) - 1)]
+            following = path[min(time + 1, len(path) - 1)]
+            if cell in occupied:
+                conflicts.append((time, occupied[cell], agent))
+            occupied[cell] = agent
+            if following != cell:
+                if (following, cell) in moves:
+                    conflicts.append((time, moves[(following, cell)], agent))
+                moves[(cell, following)] = agent
+    return conflicts
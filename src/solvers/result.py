@@ -0,0 +1,128 @@
+import math
+
+
+class SearchResult(object):
+    def __init__(self, path:list, expanded:int, elapsed:float, pushes:int = None, pops:int = None,
+                 peak_open:int = None) -> None:
+        """The outcome of a headless search
+
+        Parameters
+        ----------
+        path : list
+            The cell indices from the starting point to the ending point, empty if the end was not reached
+        expanded : int
+            Amount of cells taken out of the open set
+        elapsed : float
+            The wall-clock time of the search, in seconds
+        pushes : int, optional
+            Amount of entries put into the open set, by default None for solvers that do not count them
+        pops : int, optional
+            Amount of entries taken out of the open set, outdated ones included, by default None
+        peak_open : int, optional
+            The largest size of the open set, by default None
+        """
+        self.path = path
+        self.expanded = expanded
+        self.elapsed = elapsed
+        self.pushes = pushes
+        self.pops = pops
+        self.peak_open = peak_open
+
+    @property
+    def found(self) -> bool:
+        """Indicates whether the ending point was reached
+        """
+        return bool(self.path)
+
+    def __bool__(self) -> bool:
+        return self.found
+
+    def __repr__(self) -> str:
+        return f'SearchResult(found={self.found}, length={len(self.path)}, expanded={self.expanded})'
+
+
+def pathCost(grid, path:list) -> float:
+    """Sums the costs of the moves along a path
+
+    The straight segments between the waypoints of any-angle paths (see "solvers.thetaStar")
+    cost their Euclidean length, the terrain costs being ignored as by the any-angle solvers.
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid the path was found on
+    path : list
+        The cell indices of the path, adjacent cells or waypoints
+
+    Returns
+    -------
+    float
+        The cost of the path, 0 for an empty one
+    """
+    cost = 0
+    for a, b in zip(path, path[1:]):
+        d_row, d_col = (b // grid.cols) - (a // grid.cols), (b % grid.cols) - (a % grid.cols)
+        if abs(d_row) > 1 or abs(d_col) > 1 or (d_row and d_col and grid.topology == "square4"):
+            cost += math.hypot(d_row, d_col)
+        else:
+            cost += grid.moveCost(a, b)
+    return cost
+
+
+def buildPath(came_from:dict, end:int, observer=None) -> list:
+    """Rebuilds the path by walking back from the ending point
+
+    Parameters
+    ----------
+    came_from : dict
+        Maps each reached cell to the cell it was reached from
+    end : int
+        The ending point
+    observer : callable, optional
+        Receives (cell, "path") for each cell in the way back, by default None
+
+    Returns
+    -------
+    list
+        The cell indices from the starting point to the ending point
+    """
+    path = [end]
+    current = end
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+        if observer:
+            observer(current, "path")
+    path.reverse()
+    return path
+
+
+def buildBidirectionalPath(came_from_start:dict, came_from_end:dict, meeting:int, observer=None) -> list:
+    """Rebuilds the path of a bidirectional search by stitching the halves that meet at a cell
+
+    Parameters
+    ----------
+    came_from_start : dict
+        Maps each cell reached by the search from the starting point to the cell it was reached from
+    came_from_end : dict
+        Maps each cell reached by the search from the ending point to the cell it was reached from
+    meeting : int
+        The cell where both searches met
+    observer : callable, optional
+        Receives (cell, "path") for each cell of the path, by default None
+
+    Returns
+    -------
+    list
+        The cell indices from the starting point to the ending point
+    """
+    path = buildPath(came_from_start, meeting, observer)
+    current = meeting
+    while current in came_from_end:
+        current = came_from_end[current]
+        path.append(current)
+        if observer:
+            observer(current, "path")
+    if observer:
+        observer(meeting, "path")
+    return path
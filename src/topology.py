@@ -0,0 +1,97 @@
+import math
+
+
+SQRT2 = math.sqrt(2)
+
+# Movement rules between adjacent cells
+TOPOLOGIES = ("square4", "square8", "hex")
+
+# Rules for the diagonal moves of "square8" grids, by the two cells beside the move:
+# "cut" always allows them, "no-squeeze" forbids them when both cells are walls and
+# "no-cut" forbids them when any of them is a wall
+CORNER_RULES = ("cut", "no-squeeze", "no-cut")
+
+
+def moveTable(topology:str, parity:int) -> tuple:
+    """Gets the moves from a cell to its adjacent cells
+
+    Parameters
+    ----------
+    topology : str
+        The movement rule, one of "TOPOLOGIES"
+    parity : int
+        0 for cells in even columns, 1 for odd ones (only "hex" grids depend on it)
+
+    Returns
+    -------
+    tuple
+        The (d_row, d_col, cost) of every move, cost being sqrt(2) for diagonal moves else 1.
+        Horizontal moves come first, then vertical and then diagonal or hexagon side moves
+    """
+    if topology not in TOPOLOGIES:
+        raise AttributeError(
+            f'The topology "{topology}" has not been defined in "topology.TOPOLOGIES".\n' +
+            f'Topologies currently defined: {TOPOLOGIES}'
+        )
+
+    moves = ((0, -1, 1), (0, 1, 1), (-1, 0, 1), (1, 0, 1))
+    if topology == "square8":
+        moves += ((-1, -1, SQRT2), (-1, 1, SQRT2), (1, -1, SQRT2), (1, 1, SQRT2))
+    elif topology == "hex":
+        # Odd columns are shifted half a cell down (odd-q layout), so the side neighbors
+        # of odd columns are on the row below and the ones of even columns on the row above
+        side = 1 if parity else -1
+        moves += ((side, -1, 1), (side, 1, 1))
+    return moves
+
+
+def deltaTable(topology:str, parity:int, cols:int) -> tuple:
+    """Gets the moves of "moveTable" as index deltas over a grid with some amount of columns
+
+    Parameters
+    ----------
+    topology : str
+        The movement rule, one of "TOPOLOGIES"
+    parity : int
+        0 for cells in even columns, 1 for odd ones
+    cols : int
+        Amount of horizontal cells
+
+    Returns
+    -------
+    tuple
+        The (d_row, d_col, delta, cost, corners) of every move, delta being the difference
+        of the cell indices and corners the deltas of the two cells beside a diagonal
+        move, None for the other moves
+    """
+    table = []
+    for d_row, d_col, cost in moveTable(topology, parity):
+        corners = (d_row * cols, d_col) if topology == "square8" and d_row and d_col else None
+        table.append((d_row, d_col, (d_row * cols) + d_col, cost, corners))
+    return tuple(table)
+
+
+def cornerBlocked(corner_rule:str, first_wall:bool, second_wall:bool) -> bool:
+    """Indicates whether a diagonal move is forbidden by the cells beside it
+
+    The bitwise operators also let it work on whole NumPy arrays of moves.
+
+    Parameters
+    ----------
+    corner_rule : str
+        One of "CORNER_RULES"
+    first_wall : bool
+        Whether the vertical neighbor beside the move is a wall
+    second_wall : bool
+        Whether the horizontal neighbor beside the move is a wall
+
+    Returns
+    -------
+    bool
+        True, if the move is forbidden
+    """
+    if corner_rule == "no-cut":
+        return first_wall | second_wall
+    if corner_rule == "no-squeeze":
+        return first_wall & second_wall
+    return False